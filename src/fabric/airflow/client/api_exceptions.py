@@ -4,6 +4,11 @@ import typing as t
 class APIError(Exception):
     """Base exception for all API errors"""
     
+    # Status code -> exception class for statuses with a dedicated subclass (see register)
+    _STATUS_MAP: t.ClassVar[t.Dict[int, t.Type['APIError']]] = {}
+    
+    __slots__ = ("status", "message", "request_id", "body", "headers")
+    
     def __init__(
         self, 
         status: int,
@@ -38,6 +43,46 @@ class APIError(Exception):
     def __repr__(self):
         return f"{self.__class__.__name__}(status={self.status}, message='{self.message}', request_id='{self.request_id}')"
     
+    def __reduce__(self):
+        # The slots are not part of the default Exception pickling (which only replays args),
+        # so rebuild from every field; this also covers subclasses with a different __init__
+        return _restore_api_error, (self.__class__, self.status, self.message, self.request_id, self.body, self.headers)
+    
+    @classmethod
+    def register(cls, status: int) -> t.Callable[[t.Type['APIError']], t.Type['APIError']]:
+        """
+        Class decorator mapping a status code to a dedicated exception class.
+        
+        The decorated class must accept message, request_id, body and headers keyword
+        arguments and set its own status (see _FixedStatusClientError).
+        """
+        def decorator(klass: t.Type['APIError']) -> t.Type['APIError']:
+            klass.default_status = status  # type: ignore[attr-defined]
+            APIError._STATUS_MAP[status] = klass
+            return klass
+        return decorator
+    
+    @classmethod
+    def from_response(
+        cls,
+        status: int,
+        message: str,
+        request_id: t.Optional[str] = None,
+        body: t.Any = None,
+        headers: t.Optional[dict] = None
+    ) -> 'APIError':
+        """
+        Build the most specific exception for an HTTP error status.
+        
+        Registered statuses map to their dedicated class; other 4xx statuses map to
+        ClientError and everything else to ServerError.
+        """
+        klass = APIError._STATUS_MAP.get(status)
+        if klass is not None:
+            return klass(message=message, request_id=request_id, body=body, headers=headers)  # type: ignore[call-arg]
+        klass = ClientError if 400 <= status < 500 else ServerError
+        return klass(status=status, message=message, request_id=request_id, body=body, headers=headers)
+    
     # Backward compatibility properties
     @property
     def status_code(self) -> int:
@@ -50,63 +95,77 @@ class APIError(Exception):
         return self.body
 
 
+def _restore_api_error(
+    klass: t.Type[APIError],
+    status: int,
+    message: str,
+    request_id: t.Optional[str],
+    body: t.Any,
+    headers: t.Optional[dict]
+) -> APIError:
+    """Recreate a pickled APIError of any subclass from its fields (see APIError.__reduce__)"""
+    error = klass.__new__(klass)
+    APIError.__init__(error, status, message, request_id=request_id, body=body, headers=headers)
+    return error
+
+
 class ClientError(APIError):
     """4xx client errors (400-499)"""
-    pass
+    __slots__ = ()
 
 
 class ServerError(APIError):
     """5xx server errors (500-599)"""
-    pass
+    __slots__ = ()
 
 
-class AuthenticationError(ClientError):
-    """401 authentication errors"""
+class _FixedStatusClientError(ClientError):
+    """Base for 4xx errors whose status code is implied by the exception class"""
+    
+    __slots__ = ()
+    
+    default_status: int = 400
+    default_message: str = "Client error"
     
     def __init__(
         self, 
-        message: str = "Authentication failed", 
+        message: t.Optional[str] = None, 
         request_id: t.Optional[str] = None, 
         body: t.Any = None,
         headers: t.Optional[dict] = None
     ):
-        super().__init__(status=401, message=message, request_id=request_id, body=body, headers=headers)
+        super().__init__(
+            status=self.default_status,
+            message=message if message is not None else self.default_message,
+            request_id=request_id,
+            body=body,
+            headers=headers
+        )
+
+
+@APIError.register(401)
+class AuthenticationError(_FixedStatusClientError):
+    """401 authentication errors"""
+    __slots__ = ()
+    default_message = "Authentication failed"
 
 
-class ForbiddenError(ClientError):
+@APIError.register(403)
+class ForbiddenError(_FixedStatusClientError):
     """403 permission errors"""
-    
-    def __init__(
-        self, 
-        message: str = "Forbidden", 
-        request_id: t.Optional[str] = None, 
-        body: t.Any = None,
-        headers: t.Optional[dict] = None
-    ):
-        super().__init__(status=403, message=message, request_id=request_id, body=body, headers=headers)
+    __slots__ = ()
+    default_message = "Forbidden"
 
 
-class NotFoundError(ClientError):
+@APIError.register(404)
+class NotFoundError(_FixedStatusClientError):
     """404 not found errors"""
-    
-    def __init__(
-        self, 
-        message: str = "Resource not found", 
-        request_id: t.Optional[str] = None, 
-        body: t.Any = None,
-        headers: t.Optional[dict] = None
-    ):
-        super().__init__(status=404, message=message, request_id=request_id, body=body, headers=headers)
+    __slots__ = ()
+    default_message = "Resource not found"
 
 
-class ValidationError(ClientError):
+@APIError.register(400)
+class ValidationError(_FixedStatusClientError):
     """400 validation errors"""
-    
-    def __init__(
-        self, 
-        message: str = "Validation failed", 
-        request_id: t.Optional[str] = None, 
-        body: t.Any = None,
-        headers: t.Optional[dict] = None
-    ):
-        super().__init__(status=400, message=message, request_id=request_id, body=body, headers=headers)
\ No newline at end of file
+    __slots__ = ()
+    default_message = "Validation failed"
@@ -4,9 +4,31 @@ from azure.core.exceptions import ClientAuthenticationError
 
 from datetime import datetime, timedelta
 import jwt
+import threading
 import typing as t
 
 
+class _SharedCredential:
+    """
+    Holder of an azure-identity credential that is created on first use.
+    
+    Providers derived with with_scope() share one holder, so whichever of them needs a token
+    first creates the credential and the others reuse it.
+    """
+    
+    def __init__(self, credential: t.Optional[t.Any] = None):
+        self._credential = credential
+        self._lock = threading.Lock()
+    
+    def get(self, create: t.Callable[[], t.Any]) -> t.Any:
+        """Get the credential, calling create() to make it if it doesn't exist yet."""
+        if self._credential is None:
+            with self._lock:
+                if self._credential is None:
+                    self._credential = create()
+        return self._credential
+
+
 class AuthenticationProvider:
     """
     Provides authentication for Airflow API clients.
@@ -21,7 +43,8 @@ class AuthenticationProvider:
         client_id: t.Optional[str] = None, 
         client_secret: t.Optional[str] = None, 
         authority: str = "https://login.microsoftonline.com", 
-        scope: str = "https://api.fabric.microsoft.com/.default"
+        scope: str = "https://api.fabric.microsoft.com/.default",
+        credential: t.Optional[t.Any] = None
     ):
         """
         Initialize the AuthenticationProvider with configuration information.
@@ -32,15 +55,21 @@ class AuthenticationProvider:
             client_secret (str, optional): The application client secret for SPN authentication
             authority (str): The authentication authority URL
             scope (str): The default scope for token requests
+            credential (TokenCredential, optional): azure-identity credential to use instead of creating one.
+                Providers for different scopes can share a credential (see with_scope) so that tenant
+                discovery and interactive sign-in happen only once.
         """
         self.authority = authority
         self.tenant_id = tenant_id
         self.client_id = client_id
         self.client_secret = client_secret
         self.scope = scope
+        self._shared_credential = _SharedCredential(credential)
 
         self._cached_token = None
         self._token_expiry = None
+        # Bumped by clear_token_cache so clients drop Authorization headers built from older tokens
+        self.token_generation = 0
         
     def _is_token_expired(self) -> bool:
         """
@@ -79,6 +108,49 @@ class AuthenticationProvider:
         # Default to 1 hour if no exp claim found
         return datetime.utcnow() + timedelta(hours=1)
 
+    def _get_credential(self) -> t.Any:
+        """
+        Get the azure-identity credential, creating it on first use and reusing it afterwards.
+        
+        Returns:
+            ClientSecretCredential if client_secret is set, InteractiveBrowserCredential otherwise
+        """
+        return self._shared_credential.get(self._create_credential)
+
+    def _create_credential(self) -> t.Any:
+        """Create the azure-identity credential for this provider's configuration."""
+        if self.client_secret:
+            # Use SPN authentication - get_token validated tenant_id and client_id before calling this
+            return ClientSecretCredential(
+                tenant_id=self.tenant_id,  # type: ignore
+                client_id=self.client_id,  # type: ignore
+                client_secret=self.client_secret
+            )
+        return InteractiveBrowserCredential(tenant_id=self.tenant_id)
+
+    def with_scope(self, scope: str) -> 'AuthenticationProvider':
+        """
+        Create a provider for another scope that shares this provider's credential.
+        
+        The credential is not created here; the first get_token() call on either provider creates
+        it for both.
+        
+        Args:
+            scope (str): The scope for token requests of the new provider
+            
+        Returns:
+            AuthenticationProvider: Provider with its own token cache but the same underlying credential
+        """
+        provider = AuthenticationProvider(
+            tenant_id=self.tenant_id,
+            client_id=self.client_id,
+            client_secret=self.client_secret,
+            authority=self.authority,
+            scope=scope
+        )
+        provider._shared_credential = self._shared_credential
+        return provider
+
     def get_token(self) -> str:
         """
         Get an access token. If token was cached and not expired, return cached token.
@@ -123,20 +195,13 @@ class AuthenticationProvider:
                 print(f"Client ID: {self.client_id}")
                 print(f"Scope: {token_scope}")
                 
-                # Use SPN authentication - type checker knows these are not None due to validation above
-                credential = ClientSecretCredential(
-                    tenant_id=self.tenant_id,  # type: ignore
-                    client_id=self.client_id,  # type: ignore
-                    client_secret=self.client_secret
-                )
-                token_response = credential.get_token(token_scope)
+                token_response = self._get_credential().get_token(token_scope)
             else:
                 print(f"Attempting interactive authentication...")
                 print(f"Scope: {token_scope}")
                 
                 # Use interactive authentication
-                credential = InteractiveBrowserCredential(tenant_id=self.tenant_id)
-                token_response = credential.get_token(token_scope)
+                token_response = self._get_credential().get_token(token_scope)
             
             # Cache the token and its expiry
             self._cached_token = token_response.token
@@ -180,6 +245,7 @@ class AuthenticationProvider:
         """
         self._cached_token = None
         self._token_expiry = None
+        self.token_generation += 1
 
     def get_token_info(self) -> dict:
         """
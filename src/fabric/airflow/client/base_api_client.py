@@ -1,43 +1,178 @@
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 import json
+import copy
+import asyncio
+import concurrent.futures
 import typing as t
-import dataclasses
 import os
+import threading
+import time
 import logging
+from urllib.parse import urlencode
 
 # Import exceptions from api_exceptions module
-from fabric.airflow.client.api_exceptions import (
-    APIError,
-    ClientError,
-    ServerError,
-    AuthenticationError,
-    ForbiddenError,
-    NotFoundError,
-    ValidationError
-)
+from fabric.airflow.client.api_exceptions import APIError
 
 # Import AuthenticationProvider from separate module
 from fabric.airflow.client.authentication_provider import AuthenticationProvider
+from fabric.airflow.client.response_cache import ResponseCache
 
 
 # ---------- Setup logging for debug mode ----------
 logger = logging.getLogger(__name__)
 
-@dataclasses.dataclass
+# ---------- JSON codec (orjson when installed, see the 'fast' extra) ----------
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data: bytes) -> t.Any:
+    """Parse JSON from raw response bytes. Raises ValueError on invalid JSON."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps_bytes(obj: t.Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes for a request body."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _json_dumps(obj: t.Any, indent: bool = False) -> str:
+    """Serialize obj to a JSON string, optionally pretty-printed with a 2-space indent."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option, default=str).decode('utf-8')
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False, default=str)
+
+
+# DEBUG environment variable values that enable debug mode
+_DEBUG_TRUE_VALUES = frozenset({'true', '1', 'yes', 'on'})
+
+# Separator line used by the request/response debug logs
+_LOG_SEPARATOR = "=" * 100
+
+# Status codes treated as success by _handle_response()
+_OK_STATUSES = frozenset({200, 201, 202, 204, 304})
+
+# Request headers (lower-case) that make a GET conditional; such requests bypass the GET cache
+_CONDITIONAL_HEADERS = frozenset({"if-none-match", "if-modified-since"})
+
+# Content types whose body is parsed as JSON
+_JSON_CONTENT_TYPES = ("application/json", "text/json")
+
+
+def _is_json_content_type(ctype: str) -> bool:
+    """Check the media type part of a Content-Type header (parameters such as charset are ignored)."""
+    return ctype.partition(";")[0].strip().lower() in _JSON_CONTENT_TYPES
+
+
+def _looks_like_json(content: bytes) -> bool:
+    """Cheap check of the first non-whitespace byte for a JSON object or array."""
+    return content[:16].lstrip()[:1] in (b"{", b"[")
+
+
+def _truncated_dump(obj: t.Any, max_chars: int = 3000, max_lines: int = 50) -> t.Tuple[str, bool]:
+    """
+    Pretty-print obj as JSON for logging, producing at most about max_chars characters.
+    
+    Returns:
+        tuple: (text, truncated); a truncated text is cut to its first max_lines lines
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+        raw = orjson.dumps(obj, option=option, default=str)
+        # Decide on the byte length: a cut multibyte character is dropped by the decode
+        truncated = len(raw) > max_chars
+        text = raw[:max_chars].decode('utf-8', 'ignore')
+    else:
+        # Encode incrementally and stop as soon as the cap is exceeded
+        parts: t.List[str] = []
+        size = 0
+        for chunk in json.JSONEncoder(indent=2, ensure_ascii=False, default=str).iterencode(obj):
+            parts.append(chunk)
+            size += len(chunk)
+            if size > max_chars:
+                break
+        text = "".join(parts)
+        truncated = len(text) > max_chars
+        text = text[:max_chars]
+    if not truncated:
+        return text, False
+    return "\n".join(text.split("\n", max_lines)[:max_lines]), True
+
+
 class ApiResponse:
-    """Standard response format for all API calls."""
-    status: int
-    headers: dict
-    body: t.Any
+    """
+    Standard response format for all API calls.
+    
+    A plain __slots__ class since one is created per HTTP call. headers may be given as any
+    mapping; they are exposed as a case-insensitive dict (the requests one is kept as is).
+    """
+    __slots__ = ("status", "_headers", "body")
+
+    def __init__(self, status: int, headers: t.Mapping[str, str], body: t.Any):
+        self.status = status
+        self._headers = headers
+        self.body = body
+
+    @property
+    def headers(self) -> t.MutableMapping[str, str]:
+        if not isinstance(self._headers, CaseInsensitiveDict):
+            self._headers = CaseInsensitiveDict(self._headers)
+        return self._headers
+
+    @headers.setter
+    def headers(self, value: t.Mapping[str, str]) -> None:
+        self._headers = value
+
+    def __repr__(self) -> str:
+        return f"ApiResponse(status={self.status!r}, headers={self.headers!r}, body={self.body!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ApiResponse):
+            return NotImplemented
+        return (self.status, self.headers, self.body) == (other.status, other.headers, other.body)
+
+    __hash__ = None  # type: ignore[assignment]
 
     def to_dict(self) -> dict:
         return {
             "status": self.status,
-            "headers": self.headers,
+            "headers": dict(self.headers),
             "body": self.body
         }
 
 
+# ---------- Shared connection pools ----------
+_SHARED_ADAPTERS: t.Dict[t.Tuple[int, int], HTTPAdapter] = {}
+_SHARED_ADAPTER_LOCK = threading.Lock()
+
+
+def _get_shared_adapter(pool_connections: int, pool_maxsize: int) -> HTTPAdapter:
+    """
+    Get the process-wide HTTPAdapter for a pool size, creating it on first use.
+    
+    Sessions created by BaseApiClient._create_session() mount this adapter, so clients keep their
+    own cookies and state but reuse the same keep-alive connections.
+    """
+    key = (pool_connections, pool_maxsize)
+    adapter = _SHARED_ADAPTERS.get(key)
+    if adapter is None:
+        with _SHARED_ADAPTER_LOCK:
+            adapter = _SHARED_ADAPTERS.get(key)
+            if adapter is None:
+                adapter = _SHARED_ADAPTERS[key] = HTTPAdapter(
+                    pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    return adapter
+
+
 class BaseApiClient:
     """
     Generic base API client class that provides common functionality for derived classes.
@@ -49,10 +184,29 @@ class BaseApiClient:
     - Debug mode with request/response logging
     - Standardized response format
     - Preview mode support
+    - Keep-alive connection pools shared by all clients created without an explicit session
     
     This class is designed to be inherited by specific API clients.
     """
 
+    # Connection pool sizing of the shared adapter (clients with the same sizing share connections)
+    POOL_CONNECTIONS = 16
+    POOL_MAXSIZE = 64
+
+    # Request headers whose values are masked in debug logs (lower-case names)
+    _SENSITIVE_HEADERS = frozenset({"authorization", "x-api-key", "cookie", "x-ms-authorization-auxiliary"})
+
+    # Where _extract_request_id() looks for a request ID, in order
+    _REQUEST_ID_HEADERS = ("x-request-id", "x-ms-request-id", "request-id", "x-correlation-id")
+    _REQUEST_ID_BODY_KEYS = ("requestId", "request_id")
+
+    # Chunk size used when streaming a response body into a file object
+    STREAM_CHUNK_SIZE = 64 * 1024
+
+    # Seconds the Authorization header is reused before the auth provider is asked again (sooner
+    # after a 401 response or the provider's clear_token_cache())
+    AUTH_HEADER_TTL = 60.0
+
     def __init__(
         self,
         auth_provider: AuthenticationProvider,
@@ -62,6 +216,8 @@ class BaseApiClient:
         session: t.Optional[requests.Session] = None,
         debug: t.Optional[bool] = None,
         is_preview_enabled: bool = True,
+        enable_get_cache: bool = False,
+        cache: t.Optional[ResponseCache] = None,
     ):
         """
         Initialize the BaseApiClient.
@@ -71,49 +227,81 @@ class BaseApiClient:
             base_url: Base URL for the API
             token_scheme: Token scheme (default: Bearer)
             timeout: Request timeout in seconds
-            session: Optional requests session
+            session: Optional requests session. If None, the client gets its own session (and cookie jar)
+                on a pooled HTTPAdapter shared with other clients; pass your own session to isolate
+                this client's connections
             debug: Enable debug mode (prints requests/responses). If None, checks DEBUG environment variable
             is_preview_enabled: Whether to use preview API endpoints (adds ?preview=true to requests)
+            enable_get_cache: Keep GET responses that carry an ETag or Last-Modified header and
+                revalidate them with conditional requests (a 304 returns the kept response)
+            cache: ResponseCache holding the kept GET responses. If None and enable_get_cache is set,
+                the client creates its own; pass one to share it (derived clients also cache with it)
         """
         self.auth_provider = auth_provider
         self.base_url = base_url.rstrip("/")
         self.token_scheme = token_scheme
         self.timeout = timeout
-        self._session = session or requests.Session()
+        self._session = session if session is not None else self._create_session()
         self.preview = is_preview_enabled
         
+        # URL pieces that are the same for every request
+        self._url_prefix = self.base_url + "/"
+        self._preview_suffix = "?preview=true" if is_preview_enabled else ""
+        
+        # Default headers are built once; the Authorization header is cached for AUTH_HEADER_TTL seconds
+        self._base_headers = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "Referer": "FabricPythonAirflowClient",
+        }
+        self._auth_header: t.Optional[str] = None
+        self._auth_header_expires_at = 0.0
+        self._auth_header_generation: t.Any = None
+        
+        # GET response cache; entries kept by get() never count as fresh, they are always revalidated
+        self._owns_cache = cache is None
+        self._cache = ResponseCache() if cache is None and enable_get_cache else cache
+        self._revalidate_gets = enable_get_cache
+        
         # Debug mode - check parameter first, then environment variable
         if debug is not None:
             self.debug = debug
         else:
-            self.debug = os.getenv('DEBUG', '').lower() in ('true', '1', 'yes', 'on')
+            self.debug = os.getenv('DEBUG', '').lower() in _DEBUG_TRUE_VALUES
 
-    def _add_preview_param(self, params: t.Optional[dict] = None) -> t.Optional[dict]:
+    @classmethod
+    def _create_session(cls) -> requests.Session:
         """
-        Add preview=true parameter if preview mode is enabled.
+        Create a requests session on the shared adapter, which keeps up to POOL_MAXSIZE connections
+        alive per host. The session must not be closed, since that would close the shared pools.
+        """
+        session = requests.Session()
+        adapter = _get_shared_adapter(cls.POOL_CONNECTIONS, cls.POOL_MAXSIZE)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self) -> None:
+        """
+        Release this client's resources (currently the GET cache it created).
         
-        Args:
-            params: Existing query parameters
-            
-        Returns:
-            Updated parameters with preview=true if needed
+        The shared connection pools stay open for other clients; a session or cache passed in by
+        the caller is left for the caller to close or clear.
         """
-        if not self.preview:
-            return params
-            
-        if params is None:
-            return {"preview": "true"}
-        else:
-            # Make a copy to avoid modifying the original
-            updated_params = params.copy()
-            updated_params["preview"] = "true"
-            return updated_params
+        if self._owns_cache and self._cache is not None:
+            self._cache.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
 
     # ----- Internal helpers (protected methods for derived classes) -----
 
     def _url(self, path: str, q: t.Optional[dict] = None) -> str:
         """
-        Build full URL with query parameters.
+        Build full URL with query parameters (plus preview=true if preview mode is enabled).
         
         Args:
             path: API path relative to base URL
@@ -122,37 +310,47 @@ class BaseApiClient:
         Returns:
             str: Complete URL
         """
-        if q:
-            from urllib.parse import urlencode
-            return f"{self.base_url}/{path.lstrip('/')}?{urlencode(q, doseq=True)}"
-        return f"{self.base_url}/{path.lstrip('/')}"
+        if not q:
+            return self._url_prefix + path.lstrip('/') + self._preview_suffix
+        if self.preview:
+            q = {**q, "preview": "true"}
+        return f"{self._url_prefix}{path.lstrip('/')}?{urlencode(q, doseq=True)}"
 
     def _headers(self, extra: t.Optional[dict] = None) -> dict:
         """
         Build headers with authentication token and merge with provided headers.
         
         Args:
-            extra: Additional headers to include
+            extra: Additional headers to include (may override Accept and Content-Type)
             
         Returns:
             dict: Complete headers dictionary with authentication and defaults
         """
-        # Start with provided headers (make a copy to avoid modifying original)
-        headers = extra.copy() if extra else {}
-        
-        # Add default headers if not already present
-        if "Accept" not in headers:
-            headers["Accept"] = "application/json"
-        if "Content-Type" not in headers:
-            headers["Content-Type"] = "application/json"
-        
-        # Add authentication and referer
-        token = self.auth_provider.get_token()
-        headers["Authorization"] = f"{self.token_scheme} {token}"
-        headers["Referer"] = "FabricPythonAirflowClient"
-        
+        headers = {**self._base_headers, **extra} if extra else self._base_headers.copy()
+        headers["Authorization"] = self._cached_auth_header()
         return headers
 
+    def _cached_auth_header(self) -> str:
+        """
+        Return the Authorization header value, asking the auth provider at most once per AUTH_HEADER_TTL.
+        
+        The header is rebuilt early when the provider's token cache has been cleared since it was built.
+        """
+        now = time.monotonic()
+        generation = getattr(self.auth_provider, "token_generation", None)
+        if (self._auth_header is None or now >= self._auth_header_expires_at
+                or generation != self._auth_header_generation):
+            token = self.auth_provider.get_token()
+            self._auth_header = f"{self.token_scheme} {token}"
+            self._auth_header_expires_at = now + self.AUTH_HEADER_TTL
+            self._auth_header_generation = generation
+        return self._auth_header
+
+    def _reset_auth_header(self) -> None:
+        """Drop the cached Authorization header so the next request fetches a token again."""
+        self._auth_header = None
+        self._auth_header_expires_at = 0.0
+
     def _extract_request_id(self, response: requests.Response, body: t.Any = None) -> t.Optional[str]:
         """
         Extract request ID from response. This method can be overridden by derived classes
@@ -169,18 +367,20 @@ class BaseApiClient:
             Optional[str]: Request ID if found, None otherwise
         """
         # Try common header names first
-        request_id = (
-            response.headers.get("x-request-id") or 
-            response.headers.get("x-ms-request-id") or
-            response.headers.get("request-id") or
-            response.headers.get("x-correlation-id")
-        )
+        headers = response.headers
+        for name in self._REQUEST_ID_HEADERS:
+            request_id = headers.get(name)
+            if request_id:
+                return request_id
         
         # If not found in headers and body is a dict, try to find it in body
-        if not request_id and isinstance(body, dict):
-            request_id = body.get("requestId") or body.get("request_id")
+        if isinstance(body, dict):
+            for key in self._REQUEST_ID_BODY_KEYS:
+                request_id = body.get(key)
+                if request_id:
+                    return request_id
         
-        return request_id
+        return None
 
     def _build_exception(self, response: requests.Response) -> APIError:
         """
@@ -195,43 +395,32 @@ class BaseApiClient:
         # Try to parse response body
         body = None
         try:
-            body = response.json()
+            body = _json_loads(response.content)
             if isinstance(body, dict):
-                message = body.get("description") or body.get("message") or body.get("error") or json.dumps(body)
+                message = body.get("description") or body.get("message") or body.get("error") or _json_dumps(body)
             else:
-                message = json.dumps(body)
+                message = _json_dumps(body)
         except ValueError:
             message = response.text or f"HTTP {response.status_code}"
 
         # Extract request ID using overridable method
         request_id = self._extract_request_id(response, body)
         
-        # Common exception kwargs
-        exc_kwargs = {
-            "message": message,
-            "request_id": request_id,
-            "body": body,
-            "headers": dict(response.headers)
-        }
-        
-        # Map status codes to exception types
-        status = response.status_code
-        exception_map = {
-            400: ValidationError,
-            401: AuthenticationError,
-            403: ForbiddenError,
-            404: NotFoundError,
-        }
-        
-        # Return specific exception if status code matches
-        if status in exception_map:
-            return exception_map[status](**exc_kwargs)
-        
-        # Return generic client or server error
-        exc_kwargs["status"] = status
-        return ClientError(**exc_kwargs) if 400 <= status < 500 else ServerError(**exc_kwargs)
+        return APIError.from_response(
+            status=response.status_code,
+            message=message,
+            request_id=request_id,
+            body=body,
+            headers=dict(response.headers)
+        )
 
-    def _handle_response(self, resp: requests.Response, stream: bool = False, raise_for_status: bool = True) -> ApiResponse:
+    def _handle_response(
+        self,
+        resp: requests.Response,
+        stream: bool = False,
+        raise_for_status: bool = True,
+        dest: t.Optional[t.IO[bytes]] = None,
+    ) -> ApiResponse:
         """
         Handle HTTP response and return standardized ApiResponse.
         
@@ -239,6 +428,8 @@ class BaseApiClient:
             resp: HTTP response object
             stream: Whether to return raw bytes content
             raise_for_status: Whether to raise exceptions for non-success status codes
+            dest: Binary file object that a successful response body is written to in chunks
+                (the returned ApiResponse then has body=None)
             
         Returns:
             ApiResponse: Standardized response object
@@ -251,30 +442,34 @@ class BaseApiClient:
             ClientError: For other 4xx client errors (if raise_for_status=True)
             ServerError: For 5xx server errors (if raise_for_status=True)
         """
-        headers = dict(resp.headers)
+        status = resp.status_code
+        
+        # Error responses are turned into exceptions before any success-path work is done
+        # (304 is only returned for conditional requests and means the cached copy is current)
+        if raise_for_status and status not in _OK_STATUSES:
+            raise self._build_exception(resp)
         
-        # Always create the ApiResponse object
         body = None
-        if stream:
+        if dest is not None and status < 300:
+            # Copy the body chunk by chunk instead of holding all of it in memory
+            for chunk in resp.iter_content(chunk_size=self.STREAM_CHUNK_SIZE):
+                dest.write(chunk)
+        elif stream:
             body = resp.content
-        elif resp.content:
-            # Try JSON first, fallback to text
-            ctype = resp.headers.get("Content-Type", "")
-            if "application/json" in ctype or "text/json" in ctype:
-                try:
-                    body = resp.json()
-                except ValueError:
+        else:
+            content = resp.content
+            if content:
+                # Try JSON first, fallback to text; without a Content-Type the body is sniffed
+                ctype = resp.headers.get("Content-Type")
+                if _is_json_content_type(ctype) if ctype else _looks_like_json(content):
+                    try:
+                        body = _json_loads(content)
+                    except ValueError:
+                        body = resp.text
+                else:
                     body = resp.text
-            else:
-                body = resp.text
         
-        api_response = ApiResponse(status=resp.status_code, headers=headers, body=body)
-        
-        # Check if we should raise exceptions for non-success status codes
-        if raise_for_status and resp.status_code not in (200, 201, 202, 204):
-            raise self._build_exception(resp)
-        
-        return api_response
+        return ApiResponse(status=status, headers=resp.headers, body=body)
     
     def _request(
         self,
@@ -287,6 +482,7 @@ class BaseApiClient:
         stream: bool = False,
         params: t.Optional[dict] = None,
         raise_for_status: bool = True,
+        dest: t.Optional[t.IO[bytes]] = None,
     ) -> ApiResponse:
         """
         Make HTTP request and return standardized response.
@@ -294,38 +490,48 @@ class BaseApiClient:
         Args:
             method: HTTP method
             path: API path
-            json_body: JSON body to send
+            json_body: JSON body to send (a dict/list, or bytes that are already JSON encoded)
             data: Raw data to send
             headers: Additional headers
             stream: Whether to return raw bytes content
             params: Query parameters
             raise_for_status: Whether to raise exceptions for non-success status codes
+            dest: Binary file object to stream the response body into instead of keeping it in memory
             
         Returns:
             ApiResponse: Standardized response with status, headers, and body
         """
-        updated_params = self._add_preview_param(params)
-        url = self._url(path, q=updated_params)
+        url = self._url(path, q=params)
         request_headers = self._headers(headers)
         
-        # Log request in debug mode with better formatting
-        if self.debug:
+        # Log request in debug mode with better formatting (skipped entirely if INFO is filtered out)
+        log_enabled = self.debug and logger.isEnabledFor(logging.INFO)
+        if log_enabled:
             self._log_request(method, url, request_headers, json_body, data)
         
+        # Encode the JSON body once here (orjson when installed) instead of letting requests
+        # run json.dumps; bytes are taken as already-encoded JSON
+        if json_body is not None and data is None:
+            data = json_body if isinstance(json_body, (bytes, bytearray)) else _json_dumps_bytes(json_body)
+        
         resp = self._session.request(
             method=method,
             url=url,
             headers=request_headers,
-            json=json_body,
             data=data,
             timeout=self.timeout,
+            stream=dest is not None,
         )
         
-        # Log response in debug mode with better formatting
-        if self.debug:
-            self._log_response(resp, stream)
+        # A rejected token may have been revoked or rotated; don't keep reusing it
+        if resp.status_code == 401:
+            self._reset_auth_header()
+        
+        # Log response in debug mode with better formatting (an error body is not streamed to dest)
+        if log_enabled:
+            self._log_response(resp, stream, streamed=dest is not None and resp.status_code < 300)
         
-        return self._handle_response(resp, stream=stream, raise_for_status=raise_for_status)
+        return self._handle_response(resp, stream=stream, raise_for_status=raise_for_status, dest=dest)
 
     def _log_request(
         self,
@@ -335,116 +541,122 @@ class BaseApiClient:
         json_body: t.Any = None,
         data: t.Any = None
     ):
-        """Log HTTP request in a nicely formatted way."""
-        logger.info("=" * 100)
-        logger.info(f"🚀 {method} REQUEST")
-        logger.info("=" * 100)
-        logger.info(f"URL: {url}")
-        logger.info("")
+        """Log HTTP request in a nicely formatted way (as a single log record)."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
+        lines: t.List[str] = []
+        add = lines.append
+        add(_LOG_SEPARATOR)
+        add(f"🚀 {method} REQUEST")
+        add(_LOG_SEPARATOR)
+        add(f"URL: {url}")
+        add("")
         
         # Log headers in a clean format
-        logger.info("📋 HEADERS:")
+        add("📋 HEADERS:")
+        sensitive = self._SENSITIVE_HEADERS
         for key, value in headers.items():
             # Mask sensitive headers for security
-            if key.lower() in ('authorization', 'x-api-key'):
-                if len(value) > 30:
-                    masked_value = f"{value[:15]}...{value[-10:]}"
-                else:
-                    masked_value = "***MASKED***"
-                logger.info(f"  {key}: {masked_value}")
-            else:
-                logger.info(f"  {key}: {value}")
-        logger.info("")
-        
-        # Log request body
+            if key.lower() in sensitive:
+                value = f"{value[:15]}...{value[-10:]}" if len(value) > 30 else "***MASKED***"
+            add(f"  {key}: {value}")
+        add("")
+        
+        # Log request body (pre-encoded JSON bytes are logged like raw data)
+        if isinstance(json_body, (bytes, bytearray)) and data is None:
+            data, json_body = bytes(json_body), None
         if json_body:
-            logger.info("📦 JSON BODY:")
+            add("📦 JSON BODY:")
             try:
-                formatted_json = json.dumps(json_body, indent=2, ensure_ascii=False)
-                if len(formatted_json) > 3000:
-                    lines = formatted_json.split('\n')
-                    truncated_lines = lines[:50]  # Show first 50 lines
-                    logger.info('\n'.join(truncated_lines))
-                    logger.info(f"  ... [JSON truncated - showing first 50 lines of {len(lines)} total lines]")
-                else:
-                    logger.info(formatted_json)
+                formatted_json, truncated = _truncated_dump(json_body)
+                add(formatted_json)
+                if truncated:
+                    add("  ... [JSON truncated]")
             except Exception as e:
-                logger.info(f"  [JSON serialization failed: {e}]")
-                logger.info(f"  {str(json_body)[:1000]}...")
+                add(f"  [JSON serialization failed: {e}]")
+                add(f"  {str(json_body)[:1000]}...")
         elif data:
-            logger.info("📦 REQUEST DATA:")
+            add("📦 REQUEST DATA:")
             if isinstance(data, bytes):
                 try:
                     # Try to decode as UTF-8 text
                     text_data = data.decode('utf-8')
                     if len(text_data) > 2000:
-                        logger.info(f"  {text_data[:2000]}...")
-                        logger.info(f"  [Data truncated - total size: {len(data)} bytes]")
+                        add(f"  {text_data[:2000]}...")
+                        add(f"  [Data truncated - total size: {len(data)} bytes]")
                     else:
-                        logger.info(f"  {text_data}")
+                        add(f"  {text_data}")
                 except UnicodeDecodeError:
-                    logger.info(f"  [Binary data - {len(data)} bytes]")
+                    add(f"  [Binary data - {len(data)} bytes]")
             elif isinstance(data, str):
                 if len(data) > 2000:
-                    logger.info(f"  {data[:2000]}...")
-                    logger.info(f"  [Data truncated - total length: {len(data)} characters]")
+                    add(f"  {data[:2000]}...")
+                    add(f"  [Data truncated - total length: {len(data)} characters]")
                 else:
-                    logger.info(f"  {data}")
+                    add(f"  {data}")
             else:
-                logger.info(f"  [{type(data).__name__}] - {getattr(data, '__len__', lambda: 'unknown size')()}")
+                add(f"  [{type(data).__name__}] - {getattr(data, '__len__', lambda: 'unknown size')()}")
         else:
-            logger.info("📦 BODY: [Empty]")
+            add("📦 BODY: [Empty]")
     
-        logger.info("=" * 100)
+        add(_LOG_SEPARATOR)
+        logger.info("\n".join(lines))
 
-    def _log_response(self, resp: requests.Response, stream: bool = False):
-        """Log HTTP response in a nicely formatted way."""
-        logger.info("📡 RESPONSE")
-        logger.info("=" * 100)
+    def _log_response(self, resp: requests.Response, stream: bool = False, streamed: bool = False):
+        """Log HTTP response in a nicely formatted way (as a single log record)."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
+        lines: t.List[str] = []
+        add = lines.append
+        add("📡 RESPONSE")
+        add(_LOG_SEPARATOR)
         
         # Status with color-like indicators
         status_indicator = "✅" if 200 <= resp.status_code < 300 else "⚠️" if 400 <= resp.status_code < 500 else "❌"
-        logger.info(f"STATUS: {status_indicator} {resp.status_code} {resp.reason}")
-        logger.info("")
+        add(f"STATUS: {status_indicator} {resp.status_code} {resp.reason}")
+        add("")
         
         # Log response headers
-        logger.info("📋 RESPONSE HEADERS:")
+        add("📋 RESPONSE HEADERS:")
         for key, value in resp.headers.items():
-            logger.info(f"  {key}: {value}")
-        logger.info("")
-        
-        # Log response body
-        if not stream and resp.content:
-            logger.info("📦 RESPONSE BODY:")
+            add(f"  {key}: {value}")
+        add("")
+        
+        # Log response body (a body streamed to a file object is not read here)
+        if streamed:
+            add("📦 RESPONSE BODY:")
+            add(f"  [Streamed to file - Content-Length: {resp.headers.get('Content-Length', 'unknown')}]")
+        elif not stream and resp.content:
+            add("📦 RESPONSE BODY:")
             try:
                 # Try to parse as JSON for pretty formatting
-                json_response = resp.json()
-                formatted_json = json.dumps(json_response, indent=2, ensure_ascii=False)
-                if len(formatted_json) > 3000:
-                    lines = formatted_json.split('\n')
-                    truncated_lines = lines[:50]  # Show first 50 lines
-                    logger.info('\n'.join(truncated_lines))
-                    logger.info(f"  ... [Response truncated - showing first 50 lines of {len(lines)} total lines]")
-                else:
-                    logger.info(formatted_json)
-            except (ValueError, json.JSONDecodeError):
+                json_response = _json_loads(resp.content)
+                formatted_json, truncated = _truncated_dump(json_response)
+                add(formatted_json)
+                if truncated:
+                    add(f"  ... [Response truncated - total size: {len(resp.content)} bytes]")
+            except ValueError:
                 # Not JSON, log as text
-                text_response = resp.text
-                if len(text_response) > 2000:
-                    logger.info(f"{text_response[:2000]}...")
-                    logger.info(f"  [Response truncated - total length: {len(text_response)} characters]")
+                content = resp.content
+                if len(content) > 2000:
+                    # Decode only the part that is shown
+                    add(f"{content[:2000].decode(resp.encoding or 'utf-8', 'replace')}...")
+                    add(f"  [Response truncated - total size: {len(content)} bytes]")
                 else:
-                    logger.info(text_response)
+                    add(resp.text)
         elif stream:
-            logger.info("📦 RESPONSE BODY:")
-            logger.info(f"  [Binary/Stream content - {len(resp.content) if resp.content else 0} bytes]")
+            add("📦 RESPONSE BODY:")
+            add(f"  [Binary/Stream content - {len(resp.content) if resp.content else 0} bytes]")
             content_type = resp.headers.get('Content-Type', 'unknown')
-            logger.info(f"  Content-Type: {content_type}")
+            add(f"  Content-Type: {content_type}")
         else:
-            logger.info("📦 RESPONSE BODY: [Empty]")
+            add("📦 RESPONSE BODY: [Empty]")
         
-        logger.info("=" * 100)
-        logger.info("")
+        add(_LOG_SEPARATOR)
+        add("")
+        logger.info("\n".join(lines))
 
     def get(
         self,
@@ -454,6 +666,7 @@ class BaseApiClient:
         headers: t.Optional[dict] = None,
         stream: bool = False,
         raise_for_status: bool = True,
+        dest: t.Optional[t.IO[bytes]] = None,
     ) -> ApiResponse:
         """
         Make a GET request.
@@ -464,11 +677,90 @@ class BaseApiClient:
             headers: Additional headers
             stream: Whether to return raw bytes content
             raise_for_status: Whether to raise exceptions for non-success status codes
+            dest: Binary file object to stream the response body into (body is then None)
             
         Returns:
             ApiResponse: Standardized response object
         """
-        return self._request("GET", path, params=params, headers=headers, stream=stream, raise_for_status=raise_for_status)
+        # Streams and caller-managed conditional requests bypass the GET cache
+        if (not self._revalidate_gets or self._cache is None or stream or dest is not None
+                or (headers and any(name.lower() in _CONDITIONAL_HEADERS for name in headers))):
+            return self._request("GET", path, params=params, headers=headers, stream=stream, raise_for_status=raise_for_status, dest=dest)
+        return self._revalidating_get(path, params=params, headers=headers, raise_for_status=raise_for_status)
+
+    def _cache_key(self, path: str, params: t.Optional[dict] = None) -> t.Hashable:
+        """
+        Build the GET cache key of a path and its query parameters.
+        
+        The base URL and the auth provider are part of the key, so clients sharing a ResponseCache
+        never get responses fetched for another API or identity.
+        """
+        return (self.base_url, self.auth_provider, path.lstrip('/'), tuple(sorted(params.items())) if params else ())
+
+    @staticmethod
+    def _copy_response(response: ApiResponse) -> ApiResponse:
+        """Copy a cached response so that callers modifying it can't change the cached entry."""
+        return ApiResponse(status=response.status, headers=response.headers.copy(), body=copy.deepcopy(response.body))
+
+    def _revalidating_get(
+        self,
+        path: str,
+        *,
+        params: t.Optional[dict] = None,
+        headers: t.Optional[dict] = None,
+        raise_for_status: bool = True,
+        ttl: float = 0,
+        tags: t.Iterable[str] = (),
+    ) -> ApiResponse:
+        """
+        GET through the response cache, revalidating kept responses with their validators.
+        
+        Args:
+            path: API path (relative to base_url)
+            params: Query parameters
+            headers: Additional headers
+            raise_for_status: Whether to raise exceptions for non-success status codes
+            ttl: Seconds a response is served without a request; with 0 only responses that carry
+                an ETag or Last-Modified header are kept, and they are always revalidated
+            tags: Cache tags stored with the response (see ResponseCache.invalidate_tag)
+            
+        Returns:
+            ApiResponse: A copy of the kept response on a fresh hit or a 304, otherwise the new
+                response (a copy of it is kept)
+        """
+        assert self._cache is not None
+        key = self._cache_key(path, params)
+        if ttl > 0:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return self._copy_response(cached)
+        
+        stale = self._cache.get_stale(key)
+        if stale is not None:
+            headers = self._conditional_headers(stale, headers)
+        
+        response = self._request("GET", path, params=params, headers=headers, raise_for_status=raise_for_status)
+        if response.status == 304 and stale is not None:
+            # Not modified: renew the kept response instead of re-parsing a body
+            self._cache.set(key, stale, ttl, tags=tags)
+            response = self._copy_response(stale)
+        elif response.status == 200 and (ttl > 0 or "ETag" in response.headers or "Last-Modified" in response.headers):
+            self._cache.set(key, self._copy_response(response), ttl, tags=tags)
+        else:
+            self._cache.invalidate(key)
+        return response
+
+    @staticmethod
+    def _conditional_headers(cached: ApiResponse, headers: t.Optional[dict]) -> dict:
+        """Add If-None-Match / If-Modified-Since for the validators of a cached response."""
+        conditional = dict(headers) if headers else {}
+        etag = cached.headers.get("ETag")
+        if etag:
+            conditional["If-None-Match"] = etag
+        last_modified = cached.headers.get("Last-Modified")
+        if last_modified:
+            conditional["If-Modified-Since"] = last_modified
+        return conditional
 
     def post(
         self,
@@ -480,6 +772,7 @@ class BaseApiClient:
         headers: t.Optional[dict] = None,
         stream: bool = False,
         raise_for_status: bool = True,
+        dest: t.Optional[t.IO[bytes]] = None,
     ) -> ApiResponse:
         """
         Make a POST request.
@@ -492,11 +785,12 @@ class BaseApiClient:
             headers: Additional headers
             stream: Whether to return raw bytes content
             raise_for_status: Whether to raise exceptions for non-success status codes
+            dest: Binary file object to stream the response body into (body is then None)
             
         Returns:
             ApiResponse: Standardized response object
         """
-        return self._request("POST", path, json_body=json_body, data=data, params=params, headers=headers, stream=stream, raise_for_status=raise_for_status)
+        return self._request("POST", path, json_body=json_body, data=data, params=params, headers=headers, stream=stream, raise_for_status=raise_for_status, dest=dest)
 
     def put(
         self,
@@ -576,3 +870,139 @@ class BaseApiClient:
         """        
         return self._request("DELETE", path, params=params, headers=headers, raise_for_status=raise_for_status)
 
+    def paginate(
+        self,
+        path: str,
+        *,
+        params: t.Optional[dict] = None,
+        page_key: str = "value",
+        next_key: str = "continuationToken",
+    ) -> t.Iterator[t.Any]:
+        """
+        Iterate over the entries of a paged list API, following continuation tokens.
+        
+        The next page is requested on a background thread (over the same pooled session) as soon
+        as the current page's token is known, so it is fetched while the caller consumes the
+        current page.
+        
+        Args:
+            path: API path (relative to base_url)
+            params: Query parameters sent with every page
+            page_key: Body key holding the page entries
+            next_key: Body key (and query parameter) holding the continuation token
+            
+        Yields:
+            Entries of every page, in order
+            
+        Raises:
+            ValueError: If a page body is not a JSON object
+            
+        Example:
+            >>> for item in client.paginate(f"v1/workspaces/{workspace_id}/items"):
+            ...     print(item["displayName"])
+        """
+        def fetch(token: t.Optional[str]) -> ApiResponse:
+            page_params = dict(params) if params else {}
+            if token:
+                page_params[next_key] = token
+            return self.get(path, params=page_params or None)
+
+        return self._iter_pages(fetch, page_key=page_key, next_key=next_key)
+
+    @staticmethod
+    def _page_body(response: ApiResponse) -> dict:
+        """
+        Return the body of a page response, an empty body counting as an empty page.
+        
+        Raises:
+            ValueError: If the body is not a JSON object
+        """
+        body = response.body
+        if body is None:
+            return {}
+        if not isinstance(body, dict):
+            raise ValueError(f"Invalid API response: expected a JSON object page, got {type(body).__name__}")
+        return body
+
+    def _iter_pages(
+        self,
+        fetch_page: t.Callable[[t.Optional[str]], ApiResponse],
+        page_key: str = "value",
+        next_key: str = "continuationToken",
+    ) -> t.Iterator[t.Any]:
+        """
+        Yield the page_key entries of every page, fetching page N+1 on a background thread while
+        page N is consumed.
+        
+        Args:
+            fetch_page: Callable returning the page for a continuation token (None for the first page)
+            page_key: Body key holding the page entries
+            next_key: Body key holding the continuation token
+            
+        Raises:
+            ValueError: If a page body is not a JSON object
+        """
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="paginate")
+        future: t.Optional[concurrent.futures.Future] = executor.submit(fetch_page, None)
+        try:
+            while future is not None:
+                body = self._page_body(future.result())
+                token = body.get(next_key)
+                future = executor.submit(fetch_page, token) if token else None
+                yield from body.get(page_key, [])
+        finally:
+            if future is not None:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    # ----- Async variants (run the synchronous request on a worker thread) -----
+
+    async def _arequest(self, method: str, path: str, **kwargs) -> ApiResponse:
+        """Async variant of _request(); accepts the same keyword arguments."""
+        return await asyncio.to_thread(self._request, method, path, **kwargs)
+
+    async def aget(self, path: str, **kwargs) -> ApiResponse:
+        """Async variant of get(); accepts the same keyword arguments."""
+        return await asyncio.to_thread(self.get, path, **kwargs)
+
+    async def apost(self, path: str, **kwargs) -> ApiResponse:
+        """Async variant of post(); accepts the same keyword arguments."""
+        return await self._arequest("POST", path, **kwargs)
+
+    async def aput(self, path: str, **kwargs) -> ApiResponse:
+        """Async variant of put(); accepts the same keyword arguments."""
+        return await self._arequest("PUT", path, **kwargs)
+
+    async def apatch(self, path: str, **kwargs) -> ApiResponse:
+        """Async variant of patch(); accepts the same keyword arguments."""
+        return await self._arequest("PATCH", path, **kwargs)
+
+    async def adelete(self, path: str, **kwargs) -> ApiResponse:
+        """Async variant of delete(); accepts the same keyword arguments."""
+        return await self._arequest("DELETE", path, **kwargs)
+
+    async def abatch(
+        self,
+        calls: t.Sequence[t.Tuple[str, str, dict]],
+        return_exceptions: bool = False,
+    ) -> t.List[t.Any]:
+        """
+        Issue independent requests concurrently.
+        
+        Args:
+            calls: (method, path, kwargs) tuples, where kwargs are the keyword arguments of _request()
+            return_exceptions: Return exceptions in the result list instead of raising the first one
+            
+        Returns:
+            list: ApiResponse objects (or exceptions) in the same order as calls
+            
+        Example:
+            >>> responses = await client.abatch([
+            ...     ("GET", f"v1/workspaces/{workspace_id}", {}),
+            ...     ("GET", f"v1/workspaces/{workspace_id}/items", {"params": {"type": "ApacheAirflowJob"}}),
+            ... ])
+        """
+        return await asyncio.gather(
+            *(self._arequest(method, path, **kwargs) for method, path, kwargs in calls),
+            return_exceptions=return_exceptions,
+        )
@@ -20,11 +20,15 @@ Environment Variables:
     DEBUG: Enable debug logging (true/false)
 """
 
+import concurrent.futures
+import logging
 import os
 import typing as t
 from pathlib import Path
 from fabric.airflow.client.authentication_provider import AuthenticationProvider
 
+logger = logging.getLogger(__name__)
+
 
 class ConfigurationError(Exception):
     """Raised when required configuration is missing"""
@@ -102,11 +106,15 @@ class Config:
             client_secret=self._client_secret
         )
         
+        # Cached auth providers keyed by scope, created on first use and shared by the clients of the same API
+        self._auth_providers: t.Dict[str, AuthenticationProvider] = {}
+        
         # Cached clients
         self._files_client = None
         self._control_plane_client = None
         self._native_client = None
         self._crud_client = None
+        self._async_crud_client = None
     
     def _validate_config(self, **required_fields):
         """Validate that required configuration fields are available"""
@@ -180,6 +188,36 @@ class Config:
             scope=self._airflow_api_scope
         )
     
+    def _shared_auth_provider(self, scope: str) -> AuthenticationProvider:
+        """
+        Get the auth provider for a scope shared by this config's clients (one token per scope).
+        
+        Providers for further scopes are derived from the first one, so they share its credential
+        and tenant discovery / interactive sign-in happen only once.
+        """
+        provider = self._auth_providers.get(scope)
+        if provider is None:
+            first = next(iter(self._auth_providers.values()), None)
+            if first is not None:
+                provider = first.with_scope(scope)
+            else:
+                provider = AuthenticationProvider(
+                    tenant_id=self._tenant_id,
+                    client_id=self._client_id,
+                    client_secret=self._client_secret,
+                    scope=scope
+                )
+            self._auth_providers[scope] = provider
+        return provider
+    
+    def _shared_fabric_auth_provider(self) -> AuthenticationProvider:
+        """Get the Fabric API auth provider shared by this config's clients"""
+        return self._shared_auth_provider(self._fabric_api_scope)
+    
+    def _shared_airflow_auth_provider(self) -> AuthenticationProvider:
+        """Get the Airflow Native API auth provider shared by this config's clients"""
+        return self._shared_auth_provider(self._airflow_api_scope)
+    
     # Factory class methods for creating Config instances
     
     @classmethod
@@ -325,7 +363,7 @@ class Config:
         from fabric.airflow.client.fabric_files_api_client import AirflowFilesApiClient
         
         if self._files_client is None:
-            auth_provider = self.create_fabric_auth_provider()
+            auth_provider = self._shared_fabric_auth_provider()
             self._files_client = AirflowFilesApiClient(
                 workspace_id=self.workspace_id,
                 airflow_job_id=self.airflow_job_id,
@@ -341,7 +379,7 @@ class Config:
         from fabric.airflow.client.fabric_control_plane_api_client import FabricControlPlaneApiClient
         
         if self._control_plane_client is None:
-            auth_provider = self.create_fabric_auth_provider()
+            auth_provider = self._shared_fabric_auth_provider()
             self._control_plane_client = FabricControlPlaneApiClient(
                 workspace_id=self.workspace_id,
                 airflow_job_id=self.airflow_job_id,
@@ -357,7 +395,7 @@ class Config:
         from fabric.airflow.client.airflow_api_client import AirflowApiClient
         
         if self._native_client is None:
-            auth_provider = self.create_airflow_auth_provider()
+            auth_provider = self._shared_airflow_auth_provider()
             self._native_client = AirflowApiClient(
                 base_url=self.airflow_webserver_url,
                 auth_provider=auth_provider,
@@ -370,7 +408,7 @@ class Config:
         from fabric.airflow.client.fabric_crud_api_client import AirflowCrudApiClient
         
         if self._crud_client is None:
-            auth_provider = self.create_fabric_auth_provider()
+            auth_provider = self._shared_fabric_auth_provider()
             self._crud_client = AirflowCrudApiClient(
                 auth_provider=auth_provider,
                 base_url=self._fabric_base_url,
@@ -378,3 +416,45 @@ class Config:
                 is_preview_enabled=self._is_preview_enabled
             )
         return self._crud_client
+    
+    def async_crud_client(self):
+        """Get or create AsyncAirflowCrudApiClient instance"""
+        from fabric.airflow.client.fabric_crud_async_api_client import AsyncAirflowCrudApiClient
+        
+        if self._async_crud_client is None:
+            auth_provider = self._shared_fabric_auth_provider()
+            self._async_crud_client = AsyncAirflowCrudApiClient(
+                auth_provider=auth_provider,
+                base_url=self._fabric_base_url,
+                debug=self._debug,
+                is_preview_enabled=self._is_preview_enabled
+            )
+        return self._async_crud_client
+    
+    def warmup(self, timeout: float = 10) -> None:
+        """
+        Open connections to the Fabric API and the Airflow webserver ahead of the first real call.
+        
+        Sends a HEAD request to each base URL in parallel over the connection pools shared by the
+        clients (see BaseApiClient), so that the first API call reuses an established TLS connection.
+        Failures are logged and otherwise ignored.
+        
+        Args:
+            timeout: Timeout in seconds for each warmup request
+        """
+        import requests
+        from fabric.airflow.client.base_api_client import BaseApiClient
+        
+        session = BaseApiClient._create_session()
+        urls = [self._fabric_base_url]
+        if self._airflow_webserver_url:
+            urls.append(self._airflow_webserver_url)
+        
+        def head(url: str) -> None:
+            try:
+                session.head(url, timeout=timeout)
+            except requests.RequestException as e:
+                logger.debug(f"Warmup request to {url} failed: {e}")
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(urls)) as executor:
+            list(executor.map(head, urls))
@@ -1,12 +1,27 @@
 from fabric.airflow.client.base_api_client import BaseApiClient, AuthenticationProvider, ApiResponse
 from fabric.airflow.client.fabric_crud_model import AirflowItem, FabricItemDefinition, FabricItem
+from fabric.airflow.client.response_cache import ResponseCache
+from fabric.airflow.client.api_exceptions import ClientError, ServerError, NotFoundError
+import requests
+from urllib3.exceptions import NewConnectionError
 import typing as t
+import itertools
 import logging
+import random
+import time
 
 
 # ---------- Setup logging for debug mode ----------
 logger = logging.getLogger(__name__)
 
+# ---------- Route templates ----------
+_WORKSPACE_PATH = "v1/workspaces/{}".format
+_WORKSPACE_ITEMS_PATH = "v1/workspaces/{}/items".format
+_AIRFLOW_JOBS_PATH = "v1/workspaces/{}/apacheAirflowJobs".format
+_AIRFLOW_JOB_INSTANCE_PATH = "v1/workspaces/{}/apacheAirflowJobs/{}".format
+
+_T = t.TypeVar("_T")
+
 
 class AirflowCrudApiClient(BaseApiClient):
     """
@@ -16,12 +31,37 @@ class AirflowCrudApiClient(BaseApiClient):
     Create methods return FabricItem objects on success or raise exceptions on failure.
     
     Inherits from BaseApiClient for consistent authentication, error handling, and HTTP operations.
+    
+    Read operations listed in DEFAULT_CACHE_POLICIES can be served from a ResponseCache when one is
+    provided. Cached entries are revalidated with their ETag once expired and are invalidated for
+    the whole workspace whenever a job in it is created, updated or deleted.
+    
+    Write operations are retried with full-jitter exponential backoff, honoring Retry-After when
+    the server sends it. Throttled (429) requests and connections that could not be opened are
+    always retried. 5xx responses and connections that failed after the request was sent are
+    retried only for idempotent operations (update definition, delete), since such a create may
+    still have created the job. A delete whose retry finds the job already gone (404) counts as
+    successful.
     """
 
+    # Retry policy for write operations
+    RETRY_MAX_ATTEMPTS = 5
+    RETRY_BASE_DELAY = 0.5  # seconds
+    RETRY_MAX_DELAY = 8.0  # seconds
+
+    # Cache TTL in seconds per read operation (used only when a cache is provided)
+    DEFAULT_CACHE_POLICIES: t.Dict[str, float] = {
+        "list_airflow_jobs": 60,
+        "list_workspace_items": 60,
+        "get_workspace_info": 600,
+    }
+
     def __init__(
         self,
         auth_provider: AuthenticationProvider,
         base_url: str = "https://api.fabric.microsoft.com",
+        cache: t.Optional[ResponseCache] = None,
+        cache_policies: t.Optional[t.Dict[str, float]] = None,
         **kwargs
     ):
         """
@@ -30,23 +70,106 @@ class AirflowCrudApiClient(BaseApiClient):
         Args:
             auth_provider: AuthenticationProvider instance for token management
             base_url: Base URL for the API
+            cache: Optional ResponseCache used for read operations (no caching if None)
+            cache_policies: Overrides for DEFAULT_CACHE_POLICIES (a TTL of 0 disables caching for an operation)
             **kwargs: Additional arguments passed to BaseApiClient
         """
-        super().__init__(auth_provider, base_url=base_url, **kwargs)
+        super().__init__(auth_provider, base_url=base_url, cache=cache, **kwargs)
+        self._cache_policies = {**self.DEFAULT_CACHE_POLICIES, **(cache_policies or {})}
 
     # ----- Route construction helpers -----
 
     def _path_workspace_items(self, workspace_id: str) -> str:
         """Get workspace items root path."""
-        return f"v1/workspaces/{workspace_id}/items"
+        return _WORKSPACE_ITEMS_PATH(workspace_id)
 
     def _path_airflow_jobs(self, workspace_id: str) -> str:
         """Get Airflow jobs root path."""
-        return f"v1/workspaces/{workspace_id}/apacheAirflowJobs"
+        return _AIRFLOW_JOBS_PATH(workspace_id)
 
     def _path_airflow_job_instance(self, workspace_id: str, airflow_job_id: str) -> str:
         """Get specific Airflow job instance path."""
-        return f"{self._path_airflow_jobs(workspace_id)}/{airflow_job_id}"
+        return _AIRFLOW_JOB_INSTANCE_PATH(workspace_id, airflow_job_id)
+
+    # ----- Response caching helpers -----
+
+    def _cached_get(
+        self,
+        operation: str,
+        workspace_id: str,
+        path: str,
+        params: t.Optional[dict] = None,
+    ) -> ApiResponse:
+        """
+        GET through the response cache according to the operation's cache policy.
+        
+        Fresh entries are returned without a request. Expired entries are revalidated with their
+        ETag or Last-Modified value, and a 304 response renews the cached entry.
+        """
+        ttl = self._cache_policies.get(operation) if self._cache is not None else None
+        if not ttl:
+            return self.get(path, params=params)
+        return self._revalidating_get(path, params=params, ttl=ttl, tags=(self._workspace_cache_tag(workspace_id),))
+
+    def _workspace_cache_tag(self, workspace_id: str) -> str:
+        """Get the cache tag shared by all cached responses of a workspace."""
+        return f"ws:{workspace_id}"
+
+    def _invalidate_workspace_cache(self, workspace_id: str) -> None:
+        """Drop cached responses for a workspace after a write operation."""
+        if self._cache is not None:
+            self._cache.invalidate_tag(self._workspace_cache_tag(workspace_id))
+
+    # ----- Retry helpers -----
+
+    def _with_retry(self, operation: t.Callable[[], _T], idempotent: bool = True) -> _T:
+        """
+        Run operation, retrying throttled (429) requests, connections that could not be opened and,
+        for idempotent operations, server-side (5xx) failures and connections that failed after the
+        request was sent.
+        
+        Other errors, and the last failure once RETRY_MAX_ATTEMPTS is reached, are re-raised.
+        
+        Args:
+            operation: Callable sending the request
+            idempotent: Whether repeating a request that reached the server is safe (False for creates)
+        """
+        retryable: t.Tuple[t.Type[Exception], ...] = (ClientError, ServerError, requests.ConnectionError)
+        for attempt in range(1, self.RETRY_MAX_ATTEMPTS + 1):
+            try:
+                return operation()
+            except retryable as e:
+                if ((isinstance(e, ClientError) and e.status != 429)
+                        or (isinstance(e, ServerError) and not idempotent)
+                        or (isinstance(e, requests.ConnectionError) and not idempotent
+                            and not self._failed_before_send(e))
+                        or attempt == self.RETRY_MAX_ATTEMPTS):
+                    raise
+                delay = self._retry_delay(e, attempt)
+                logger.warning(f"Request failed ({getattr(e, 'status', type(e).__name__)}), retrying in {delay:.2f}s "
+                               f"(attempt {attempt}/{self.RETRY_MAX_ATTEMPTS})")
+                time.sleep(delay)
+        raise AssertionError("unreachable")
+
+    @staticmethod
+    def _failed_before_send(error: requests.ConnectionError) -> bool:
+        """Check whether a connection error happened before any of the request reached the server."""
+        if isinstance(error, requests.ConnectTimeout):
+            return True
+        # requests wraps urllib3's MaxRetryError, whose reason is the underlying connection error
+        reason = error.args[0] if error.args else None
+        return isinstance(getattr(reason, "reason", reason), NewConnectionError)
+
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        """Get the delay before the next attempt: Retry-After if present, else full-jitter backoff."""
+        headers = getattr(error, "headers", None) or {}
+        retry_after = headers.get("Retry-After") or headers.get("retry-after")
+        if retry_after:
+            try:
+                return min(float(retry_after), self.RETRY_MAX_DELAY * 4)
+            except ValueError:
+                pass  # HTTP-date form, fall back to backoff
+        return random.uniform(0, min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2 ** (attempt - 1)))
 
     # ----- Airflow Job Creation -----
 
@@ -73,9 +196,11 @@ class AirflowCrudApiClient(BaseApiClient):
             ClientError: For other 4xx client errors
             ServerError: For 5xx server errors
         """
-        response = self.post(
+        json_body = request.to_dict()
+        response = self._with_retry(lambda: self.post(
             path=self._path_airflow_jobs(workspace_id), 
-            json_body=request.to_dict())
+            json_body=json_body), idempotent=False)
+        self._invalidate_workspace_cache(workspace_id)
         return self._handle_create_response(response)
 
     def create_airflow_job_with_definition(
@@ -101,9 +226,11 @@ class AirflowCrudApiClient(BaseApiClient):
             ClientError: For other 4xx client errors
             ServerError: For 5xx server errors
         """
-        response = self.post(
+        json_body = request.to_dict()
+        response = self._with_retry(lambda: self.post(
             path=self._path_workspace_items(workspace_id),
-            json_body=request.to_dict())
+            json_body=json_body), idempotent=False)
+        self._invalidate_workspace_cache(workspace_id)
         return self._handle_create_response(response)
 
     def _handle_create_response(self, response: ApiResponse) -> FabricItem:
@@ -198,10 +325,29 @@ class AirflowCrudApiClient(BaseApiClient):
         Returns:
             ApiResponse: Response containing list of jobs
         """
-        return self.get(
-            path = self._path_airflow_jobs(workspace_id),
+        return self._cached_get(
+            "list_airflow_jobs",
+            workspace_id,
+            path=self._path_airflow_jobs(workspace_id),
             params={"continuationToken": continuation_token} if continuation_token else None)
 
+    def iter_airflow_jobs(self, workspace_id: str) -> t.Iterator[dict]:
+        """
+        Iterate over all Airflow jobs in workspace, following continuation tokens.
+        
+        The next page is requested while the entries of the current page are being consumed.
+        
+        Args:
+            workspace_id: Workspace ID
+            
+        Yields:
+            dict: Airflow job entries from every page
+            
+        Example:
+            >>> job_names = [job['displayName'] for job in crud_client.iter_airflow_jobs(workspace_id)]
+        """
+        return self._iter_pages(lambda token: self.list_airflow_jobs(workspace_id, token))
+
     # ----- Airflow Job Updating -----
 
     def update_airflow_job_definition(
@@ -223,10 +369,13 @@ class AirflowCrudApiClient(BaseApiClient):
         Returns:
             ApiResponse: Response from update operation
         """
-        return self.post(
+        json_body = definition.to_dict()
+        response = self._with_retry(lambda: self.post(
             path = f"{self._path_airflow_job_instance(workspace_id, airflow_job_id)}/updateDefinition", 
-            json_body=definition.to_dict(), 
-            params={"updateMetadata": "true" if update_metadata else "false"})
+            json_body=json_body, 
+            params={"updateMetadata": "true" if update_metadata else "false"}))
+        self._invalidate_workspace_cache(workspace_id)
+        return response
 
     # ----- Airflow Job Deletion -----
 
@@ -243,11 +392,25 @@ class AirflowCrudApiClient(BaseApiClient):
             airflow_job_id: Airflow job ID
             
         Returns:
-            ApiResponse: Response from delete operation
+            ApiResponse: Response from delete operation (status 404 if a retry found the job already deleted)
         """
-        return self.delete(
-            path=self._path_airflow_job_instance(workspace_id, airflow_job_id)
-        )
+        path = self._path_airflow_job_instance(workspace_id, airflow_job_id)
+        attempts = itertools.count(1)
+        
+        def delete() -> ApiResponse:
+            attempt = next(attempts)
+            try:
+                return self.delete(path=path)
+            except NotFoundError as e:
+                if attempt == 1:
+                    raise
+                # A failed earlier attempt may still have deleted the job
+                logger.info(f"Airflow job {airflow_job_id} already deleted (attempt {attempt})")
+                return ApiResponse(status=e.status, headers=e.headers or {}, body=e.body)
+        
+        response = self._with_retry(delete)
+        self._invalidate_workspace_cache(workspace_id)
+        return response
 
     # ----- Workspace Operations -----
 
@@ -264,8 +427,8 @@ class AirflowCrudApiClient(BaseApiClient):
         Returns:
             ApiResponse: Response containing workspace details
         """
-        path = f"v1/workspaces/{workspace_id}"
-        return self.get(path)
+        path = _WORKSPACE_PATH(workspace_id)
+        return self._cached_get("get_workspace_info", workspace_id, path)
 
     def list_workspace_items(
         self,
@@ -290,9 +453,30 @@ class AirflowCrudApiClient(BaseApiClient):
         if continuation_token:
             params["continuationToken"] = continuation_token
         
-        return self.get(
+        return self._cached_get(
+            "list_workspace_items",
+            workspace_id,
             path=self._path_workspace_items(workspace_id),
             params=params if params else None
         )
 
+    def iter_workspace_items(
+        self,
+        workspace_id: str,
+        type_filter: t.Optional[str] = None,
+    ) -> t.Iterator[dict]:
+        """
+        Iterate over all items in workspace, following continuation tokens.
+        
+        The next page is requested while the entries of the current page are being consumed.
+        
+        Args:
+            workspace_id: Workspace ID
+            type_filter: Filter by item type (e.g., "ApacheAirflowJob")
+            
+        Yields:
+            dict: Workspace item entries from every page
+        """
+        return self._iter_pages(lambda token: self.list_workspace_items(workspace_id, type_filter, token))
+
 # For usage examples, see: src/sample/example_usage.py
\ No newline at end of file
@@ -0,0 +1,188 @@
+from fabric.airflow.client.base_api_client import AuthenticationProvider, ApiResponse
+from fabric.airflow.client.fabric_crud_api_client import AirflowCrudApiClient
+from fabric.airflow.client.fabric_crud_model import AirflowItem, FabricItemDefinition, FabricItem
+import asyncio
+import typing as t
+import logging
+
+
+# ---------- Setup logging for debug mode ----------
+logger = logging.getLogger(__name__)
+
+
+class AsyncAirflowCrudApiClient:
+    """
+    Asyncio variant of AirflowCrudApiClient.
+
+    Exposes the same operations as coroutines so that independent calls can be overlapped with
+    asyncio.gather(). Each call runs the synchronous AirflowCrudApiClient in a worker thread, so
+    authentication, error handling, debug logging and the pooled requests session are shared
+    with the synchronous client. Concurrency is bounded by max_concurrency.
+
+    Example:
+        >>> async with AsyncAirflowCrudApiClient(auth_provider) as client:
+        ...     jobs, items = await asyncio.gather(
+        ...         client.list_airflow_jobs(workspace_id),
+        ...         client.list_workspace_items(workspace_id),
+        ...     )
+    """
+
+    def __init__(
+        self,
+        auth_provider: AuthenticationProvider,
+        base_url: str = "https://api.fabric.microsoft.com",
+        max_concurrency: int = 16,
+        **kwargs
+    ):
+        """
+        Initialize the AsyncAirflowCrudApiClient.
+
+        Args:
+            auth_provider: AuthenticationProvider instance for token management
+            base_url: Base URL for the API
+            max_concurrency: Maximum number of requests in flight at once
+            **kwargs: Additional arguments passed to AirflowCrudApiClient
+        """
+        self._client = AirflowCrudApiClient(auth_provider, base_url=base_url, **kwargs)
+        self._max_concurrency = max_concurrency
+        # Created in the running loop on first use, since the client may outlive a loop (Config caches it)
+        self._semaphore: t.Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: t.Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def sync_client(self) -> AirflowCrudApiClient:
+        """The underlying synchronous client."""
+        return self._client
+
+    async def __aenter__(self) -> 'AsyncAirflowCrudApiClient':
+        # Acquire the token once up front so concurrent calls don't all authenticate at the same time
+        await asyncio.to_thread(self._client.auth_provider.get_token)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Release the underlying client's resources. See AirflowCrudApiClient.close."""
+        self._client.close()
+
+    async def _call(self, func: t.Callable[..., t.Any], *args, **kwargs) -> t.Any:
+        """Run a synchronous client method in a worker thread, bounded by the concurrency limit."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._semaphore_loop = loop
+        async with self._semaphore:
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+    # ----- Airflow Job Creation -----
+
+    async def create_airflow_job(self, workspace_id: str, request: AirflowItem) -> FabricItem:
+        """Create a new Airflow job with blank payload. See AirflowCrudApiClient.create_airflow_job."""
+        return await self._call(self._client.create_airflow_job, workspace_id, request)
+
+    async def create_airflow_job_with_definition(self, workspace_id: str, request: FabricItemDefinition) -> FabricItem:
+        """Create a new Airflow job with definition. See AirflowCrudApiClient.create_airflow_job_with_definition."""
+        return await self._call(self._client.create_airflow_job_with_definition, workspace_id, request)
+
+    # ----- Airflow Job Reading -----
+
+    async def get_airflow_job(self, workspace_id: str, airflow_job_id: str) -> ApiResponse:
+        """Get Airflow job metadata. See AirflowCrudApiClient.get_airflow_job."""
+        return await self._call(self._client.get_airflow_job, workspace_id, airflow_job_id)
+
+    async def get_airflow_job_definition(
+        self,
+        workspace_id: str,
+        airflow_job_id: str,
+        response_format: str = "json",
+    ) -> FabricItemDefinition:
+        """Get Airflow job definition. See AirflowCrudApiClient.get_airflow_job_definition."""
+        return await self._call(self._client.get_airflow_job_definition, workspace_id, airflow_job_id, response_format)
+
+    async def list_airflow_jobs(self, workspace_id: str, continuation_token: t.Optional[str] = None) -> ApiResponse:
+        """List Airflow jobs in workspace. See AirflowCrudApiClient.list_airflow_jobs."""
+        return await self._call(self._client.list_airflow_jobs, workspace_id, continuation_token)
+
+    async def iter_airflow_jobs(self, workspace_id: str) -> t.AsyncIterator[dict]:
+        """
+        Iterate over all Airflow jobs in workspace, following continuation tokens.
+        
+        The next page is requested while the entries of the current page are being consumed.
+        """
+        async for item in self._iter_pages(lambda token: self.list_airflow_jobs(workspace_id, token)):
+            yield item
+
+    # ----- Airflow Job Updating -----
+
+    async def update_airflow_job_definition(
+        self,
+        workspace_id: str,
+        airflow_job_id: str,
+        definition: FabricItemDefinition,
+        update_metadata: bool = True,
+    ) -> ApiResponse:
+        """Update Airflow job definition. See AirflowCrudApiClient.update_airflow_job_definition."""
+        return await self._call(
+            self._client.update_airflow_job_definition, workspace_id, airflow_job_id, definition, update_metadata)
+
+    # ----- Airflow Job Deletion -----
+
+    async def delete_airflow_job(self, workspace_id: str, airflow_job_id: str) -> ApiResponse:
+        """Delete Airflow job. See AirflowCrudApiClient.delete_airflow_job."""
+        return await self._call(self._client.delete_airflow_job, workspace_id, airflow_job_id)
+
+    # ----- Workspace Operations -----
+
+    async def get_workspace_info(self, workspace_id: str) -> ApiResponse:
+        """Get workspace information. See AirflowCrudApiClient.get_workspace_info."""
+        return await self._call(self._client.get_workspace_info, workspace_id)
+
+    async def list_workspace_items(
+        self,
+        workspace_id: str,
+        type_filter: t.Optional[str] = None,
+        continuation_token: t.Optional[str] = None,
+    ) -> ApiResponse:
+        """List all items in workspace. See AirflowCrudApiClient.list_workspace_items."""
+        return await self._call(self._client.list_workspace_items, workspace_id, type_filter, continuation_token)
+
+    async def iter_workspace_items(
+        self,
+        workspace_id: str,
+        type_filter: t.Optional[str] = None,
+    ) -> t.AsyncIterator[dict]:
+        """
+        Iterate over all items in workspace, following continuation tokens.
+        
+        The next page is requested while the entries of the current page are being consumed.
+        """
+        async for item in self._iter_pages(
+                lambda token: self.list_workspace_items(workspace_id, type_filter, token)):
+            yield item
+
+    # ----- Pagination helpers -----
+
+    async def _iter_pages(
+        self,
+        fetch_page: t.Callable[[t.Optional[str]], t.Coroutine[t.Any, t.Any, ApiResponse]],
+    ) -> t.AsyncIterator[dict]:
+        """
+        Yield the 'value' entries of every page, prefetching page N+1 while page N is consumed.
+        
+        Raises:
+            ValueError: If a page body is not a JSON object
+        """
+        next_page = asyncio.create_task(fetch_page(None))
+        try:
+            while next_page is not None:
+                body = self._client._page_body(await next_page)
+                continuation_token = body.get('continuationToken')
+                next_page = asyncio.create_task(fetch_page(continuation_token)) if continuation_token else None
+                for item in body.get('value', []):
+                    yield item
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+# For usage examples, see: src/sample/example_usage.py
@@ -1,11 +1,30 @@
 import dataclasses
 import json
 import base64
+import binascii
 import typing as t
 import logging
+import pathlib
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+# Optional accelerated serializers (pip install fabric-airflow-client[fast])
+try:
+    import orjson
+
+    def _json_dumps_bytes(obj: t.Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _json_dumps_bytes(obj: t.Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('ascii')
+
+try:
+    from pybase64 import b64encode as _b64encode
+except ImportError:
+    def _b64encode(data: bytes) -> bytes:
+        return binascii.b2a_base64(data, newline=False)
+
 # Public API - only export these classes
 __all__ = [
     'FabricItemDefinition',
@@ -13,7 +32,16 @@ __all__ = [
     'FabricItem'
 ]
 
-@dataclasses.dataclass
+# Serialized .platform payload around the displayName value; equivalent to json.dumps of
+# {"$schema": ..., "metadata": {"type": ..., "displayName": ...}, "config": {...}}
+_PLATFORM_PAYLOAD_PREFIX = (
+    '{"$schema": "https://developer.microsoft.com/json-schemas/fabric/gitIntegration/platformProperties/2.0.0/schema.json", '
+    '"metadata": {"type": "ApacheAirflowJob", "displayName": '
+)
+_PLATFORM_PAYLOAD_SUFFIX = '}, "config": {"version": "2.0", "logicalId": "00000000-0000-0000-0000-000000000000"}}'
+
+
+@dataclasses.dataclass(slots=True)
 class _FabricItemDefinitionPart:
     """
     Internal class representing a part of the Fabric item definition.
@@ -23,12 +51,26 @@ class _FabricItemDefinitionPart:
     path: str
     payload: t.Union[str, dict]  # Original payload (string or dict), not yet base64 encoded
     payloadType: str = "InlineBase64"
+    # Base64 encoding of a string payload, reused while payload still refers to the same object.
+    # Dict payloads are never cached since they can be modified in place (see as_json).
+    _encoded_source: t.Optional[str] = dataclasses.field(default=None, init=False, repr=False, compare=False)
+    _encoded_payload: t.Optional[str] = dataclasses.field(default=None, init=False, repr=False, compare=False)
     
     @classmethod
     def _from_string(cls, path: str, content: str) -> '_FabricItemDefinitionPart':
         """Internal: Create a part from string content."""
         return cls(path=path, payload=content, payloadType="InlineBase64")
     
+    @classmethod
+    def _from_file(cls, path: str, file_path: str) -> '_FabricItemDefinitionPart':
+        """Internal: Create a part from a UTF-8 text file, encoding the raw file bytes once."""
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        part = cls(path=path, payload=raw.decode('utf-8'), payloadType="InlineBase64")
+        part._encoded_source = part.payload
+        part._encoded_payload = _b64encode(raw).decode('ascii')
+        return part
+    
     @classmethod
     def _from_dict(cls, path: str, content: dict) -> '_FabricItemDefinitionPart':
         """Internal: Create a part from dictionary content."""
@@ -46,7 +88,12 @@ class _FabricItemDefinitionPart:
             # For other payload types, keep as-is
             payload = encoded_payload
         
-        return cls(path=path, payload=payload, payloadType=payload_type)
+        part = cls(path=path, payload=payload, payloadType=payload_type)
+        if payload_type == "InlineBase64":
+            # Unmodified parts are sent back with the payload exactly as received
+            part._encoded_source = payload
+            part._encoded_payload = encoded_payload
+        return part
     
     def as_json(self) -> t.Optional[dict]:
         """
@@ -74,12 +121,19 @@ class _FabricItemDefinitionPart:
     
     def to_dict(self) -> dict:
         """Convert to dictionary for API request, encoding payload to base64."""
-        # Encode to base64
+        # Encode to base64. Most DAG sources are plain ASCII, so the cheaper ASCII codec is tried first.
         if isinstance(self.payload, dict):
-            payload_bytes = json.dumps(self.payload).encode('utf-8')
+            encoded_payload = _b64encode(_json_dumps_bytes(self.payload)).decode('ascii')
+        elif self._encoded_source is self.payload:
+            encoded_payload = self._encoded_payload
         else:
-            payload_bytes = self.payload.encode('utf-8')
-        encoded_payload = base64.b64encode(payload_bytes).decode('utf-8')
+            if self.payload.isascii():
+                payload_bytes = self.payload.encode('ascii')
+            else:
+                payload_bytes = self.payload.encode('utf-8')
+            encoded_payload = _b64encode(payload_bytes).decode('ascii')
+            self._encoded_source = self.payload
+            self._encoded_payload = encoded_payload
         
         return {
             "path": self.path,
@@ -88,7 +142,7 @@ class _FabricItemDefinitionPart:
         }
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(init=False, slots=True)
 class FabricItemDefinition:
     """
     Request model for creating an Airflow job with definition.
@@ -109,7 +163,7 @@ class FabricItemDefinition:
     """
     displayName: str
     description: t.Optional[str] = None
-    parts: t.List[_FabricItemDefinitionPart] = dataclasses.field(default_factory=list, init=False)
+    parts: t.List[_FabricItemDefinitionPart]
     
     def __init__(self, displayName: str, airflow_definition_file: str, description: t.Optional[str] = None):
         """
@@ -124,19 +178,9 @@ class FabricItemDefinition:
         self.description = description
         self.parts = []
         
-        # Add required .platform file
-        platform_payload = {
-            "$schema": "https://developer.microsoft.com/json-schemas/fabric/gitIntegration/platformProperties/2.0.0/schema.json",
-            "metadata": {
-                "type": "ApacheAirflowJob",
-                "displayName": self.displayName
-            },
-            "config": {
-                "version": "2.0",
-                "logicalId": "00000000-0000-0000-0000-000000000000"
-            }
-        }
-        self.parts.append(_FabricItemDefinitionPart._from_dict(".platform", platform_payload))
+        # Add required .platform file (only displayName varies, so splice it into the constant JSON)
+        platform_payload = _PLATFORM_PAYLOAD_PREFIX + json.dumps(self.displayName) + _PLATFORM_PAYLOAD_SUFFIX
+        self.parts.append(_FabricItemDefinitionPart._from_string(".platform", platform_payload))
         
         # Add Airflow definition from file
         with open(airflow_definition_file, 'r', encoding='utf-8') as f:
@@ -161,11 +205,66 @@ class FabricItemDefinition:
             # Remove the existing part
             self.parts = [p for p in self.parts if p.path != dag_path]
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        self.parts.append(_FabricItemDefinitionPart._from_string(dag_path, content))
+        self.parts.append(_FabricItemDefinitionPart._from_file(dag_path, file_path))
+        return self
+    
+    def add_dag_files(self, dag_files: t.Dict[str, str], max_workers: int = 8) -> 'FabricItemDefinition':
+        """
+        Add several DAG files from disk, reading them concurrently. Returns self for method chaining.
+        
+        Args:
+            dag_files: Mapping of destination path in the Airflow job to source file path on disk
+            max_workers: Maximum number of threads used to read the files
+            
+        Example:
+            >>> definition.add_dag_files({
+            ...     "dags/etl_dag.py": "/local/path/to/etl_dag.py",
+            ...     "dags/report_dag.py": "/local/path/to/report_dag.py",
+            ... })
+        """
+        if not dag_files:
+            return self
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            new_parts = list(executor.map(_FabricItemDefinitionPart._from_file, dag_files.keys(), dag_files.values()))
+        
+        # Remove parts that are being overridden in a single pass
+        overridden = {part.path for part in self.parts}.intersection(dag_files)
+        if overridden:
+            for dag_path in overridden:
+                logger.warning(f"Overriding existing part: {dag_path}")
+            self.parts = [p for p in self.parts if p.path not in overridden]
+        
+        self.parts.extend(new_parts)
         return self
     
+    def add_dag_directory(
+        self,
+        dest_prefix: str,
+        local_dir: str,
+        pattern: str = "*.py",
+        max_workers: int = 8,
+    ) -> 'FabricItemDefinition':
+        """
+        Add every file under a local directory, reading them concurrently. Returns self for method chaining.
+        
+        Args:
+            dest_prefix: Destination directory in the Airflow job (e.g., "dags")
+            local_dir: Local directory to walk recursively
+            pattern: Glob pattern of the files to add
+            max_workers: Maximum number of threads used to read the files
+            
+        Example:
+            >>> definition.add_dag_directory("dags", "/local/path/to/dags")
+        """
+        root = pathlib.Path(local_dir)
+        prefix = dest_prefix.rstrip('/')
+        dag_files = {
+            f"{prefix}/{path.relative_to(root).as_posix()}": str(path)
+            for path in sorted(root.rglob(pattern)) if path.is_file()
+        }
+        return self.add_dag_files(dag_files, max_workers=max_workers)
+    
     def add_dag(self, dag_path: str, content: str) -> 'FabricItemDefinition':
         """
         Add a DAG from string content. Returns self for method chaining.
@@ -271,23 +370,26 @@ class FabricItemDefinition:
         return d
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AirflowItem:
     """Request model for creating Airflow item with basic properties."""
     displayName: str
     description: t.Optional[str] = None
     
     def to_dict(self) -> dict:
-        d = {
+        if self.description:
+            return {
+                "displayName": self.displayName,
+                "type": "ApacheAirflowJob",
+                "description": self.description
+            }
+        return {
             "displayName": self.displayName,
             "type": "ApacheAirflowJob"
         }
-        if self.description:
-            d["description"] = self.description
-        return d
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class FabricItem:
     """Represents a Fabric item (e.g., Apache Airflow Job, Notebook, etc.)."""
     id: str
@@ -309,12 +411,17 @@ class FabricItem:
     
     def to_dict(self) -> dict:
         """Convert to dictionary."""
-        d = {
+        if self.description:
+            return {
+                "id": self.id,
+                "type": self.type,
+                "displayName": self.displayName,
+                "workspaceId": self.workspaceId,
+                "description": self.description
+            }
+        return {
             "id": self.id,
             "type": self.type,
             "displayName": self.displayName,
             "workspaceId": self.workspaceId
         }
-        if self.description:
-            d["description"] = self.description
-        return d
\ No newline at end of file
@@ -1,6 +1,8 @@
 from .base_api_client_airflow import AirflowBaseApiClient
 from .base_api_client import AuthenticationProvider, ApiResponse
 import typing as t
+import concurrent.futures
+import gzip
 import logging
 
 # ---------- Setup logging for debug mode ----------
@@ -22,12 +24,16 @@ class AirflowFilesApiClient(AirflowBaseApiClient):
     - Custom modules: "include/my_module.py"
     """
 
+    # Uploads smaller than this are sent uncompressed when compression is enabled
+    COMPRESSION_THRESHOLD = 4096
+
     def __init__(
         self,
         auth_provider: AuthenticationProvider,
         workspace_id: str,
         airflow_job_id: str,
         base_url: str = "https://api.fabric.microsoft.com",
+        enable_compression: bool = False,
         **kwargs
     ):
         """
@@ -38,23 +44,38 @@ class AirflowFilesApiClient(AirflowBaseApiClient):
             workspace_id: Workspace ID for all operations
             airflow_job_id: Airflow job ID for all operations
             base_url: Base URL for the API
+            enable_compression: Gzip-compress uploads larger than COMPRESSION_THRESHOLD bytes
+                (sent with Content-Encoding: gzip; only enable if the endpoint accepts it)
             **kwargs: Additional arguments passed to AirflowBaseApiClient
         """
         super().__init__(auth_provider, workspace_id, airflow_job_id, base_url=base_url, **kwargs)
+        self.enable_compression = enable_compression
+
+    # ----- Route construction helpers -----
+
+    @staticmethod
+    def _normalize_file_path(file_path: str) -> str:
+        """Strip leading slashes from a file path (already-relative paths are returned as-is)."""
+        return file_path.lstrip('/') if file_path.startswith('/') else file_path
+
+    def _file_instance(self, file_path: str) -> str:
+        """Get specific file path within the job."""
+        return f"{self._job_instance()}/files/{self._normalize_file_path(file_path)}"
 
     # ----- Files (create/update, get, list, delete) -----
 
     def create_or_update_file(
         self,
         file_path: str,
-        content: t.Union[str, bytes],
+        content: t.Union[str, bytes, t.IO[bytes]],
     ) -> ApiResponse:
         """
         Create or update a file in the Airflow job.
         
         Args:
             file_path: Path of the file within the job (e.g., "dags/my_dag.py", "plugins/my_plugin.py")
-            content: File content as string or bytes
+            content: File content as string or bytes, or a binary file object whose content is
+                streamed to the server without being read into memory (sent uncompressed)
             
         Returns:
             ApiResponse: Response from the create/update operation
@@ -68,8 +89,12 @@ class AirflowFilesApiClient(AirflowBaseApiClient):
             
             # Upload requirements
             client.create_or_update_file("requirements.txt", "pandas>=1.0\\nnumpy>=1.20")
+            
+            # Stream a large plugin straight from disk
+            with open("my_plugin.whl", "rb") as f:
+                client.create_or_update_file("plugins/my_plugin.whl", f)
         """
-        path = f"{self._job_instance()}/files/{file_path.lstrip('/')}"
+        path = self._file_instance(file_path)
         headers = {}
         if isinstance(content, str):
             data = content.encode("utf-8")
@@ -77,20 +102,27 @@ class AirflowFilesApiClient(AirflowBaseApiClient):
         else:
             data = content
             headers["Content-Type"] = "application/octet-stream"
+        if (self.enable_compression and isinstance(data, (bytes, bytearray))
+                and len(data) > self.COMPRESSION_THRESHOLD):
+            data = gzip.compress(data, compresslevel=1)
+            headers["Content-Encoding"] = "gzip"
         return self.put(path, data=data, headers=headers)
 
     def get_file(
         self,
         file_path: str,
+        dest: t.Optional[t.IO[bytes]] = None,
     ) -> ApiResponse:
         """
         Get file content from Airflow job.
         
         Args:
             file_path: Path of the file within the job (e.g., "dags/my_dag.py")
+            dest: Optional binary file object to stream the content into instead of
+                returning it in memory
             
         Returns:
-            ApiResponse: Response containing file content as bytes
+            ApiResponse: Response containing file content as bytes (None if dest is given)
             
         Examples:
             # Get a DAG file
@@ -99,9 +131,13 @@ class AirflowFilesApiClient(AirflowBaseApiClient):
             
             # Get requirements file
             response = client.get_file("requirements.txt")
+            
+            # Download a large file straight to disk
+            with open("big_file.bin", "wb") as f:
+                client.get_file("plugins/big_file.bin", dest=f)
         """
-        path = f"{self._job_instance()}/files/{file_path.lstrip('/')}"
-        return self.get(path, stream=True)
+        path = self._file_instance(file_path)
+        return self.get(path, stream=True, dest=dest)
 
     def list_files(
         self,
@@ -156,8 +192,37 @@ class AirflowFilesApiClient(AirflowBaseApiClient):
             # Delete a plugin file
             client.delete_file("plugins/unused_plugin.py")
         """
-        path = f"{self._job_instance()}/files/{file_path.lstrip('/')}"
+        path = self._file_instance(file_path)
         return self.delete(path)
 
+    def delete_files(
+        self,
+        file_paths: t.Iterable[str],
+        max_workers: int = 8,
+    ) -> t.List[ApiResponse]:
+        """
+        Delete several files from Airflow job, issuing the deletes concurrently.
+        
+        Every delete is attempted even if some of them fail; the first failure (in input order)
+        is raised once all of them have completed.
+        
+        Args:
+            file_paths: Paths of the files within the job
+            max_workers: Maximum number of deletes in flight at once
+            
+        Returns:
+            List[ApiResponse]: Responses from the delete operations, in input order
+            
+        Examples:
+            # Delete a DAG and its plugin
+            client.delete_files(["dags/old_dag.py", "plugins/old_plugin.py"])
+        """
+        file_paths = list(file_paths)
+        if not file_paths:
+            return []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(file_paths))) as executor:
+            futures = [executor.submit(self.delete_file, file_path) for file_path in file_paths]
+        return [future.result() for future in futures]
+
 
 # For usage examples, see: src/sample/example_usage.py
@@ -0,0 +1,90 @@
+import collections
+import random
+import threading
+import time
+import typing as t
+
+if t.TYPE_CHECKING:
+    # Only needed for annotations; base_api_client imports this module
+    from fabric.airflow.client.base_api_client import ApiResponse
+
+
+class ResponseCache:
+    """
+    Thread-safe in-memory cache of ApiResponse objects.
+
+    Entries expire after a per-entry TTL (with a small random jitter so that entries cached
+    together don't all expire together) and can be tagged, e.g. with the workspace they belong
+    to, so that related entries can be invalidated at once after a write. Expired entries are
+    kept until evicted so that their ETag can still be used to revalidate them.
+
+    Example:
+        >>> cache = ResponseCache()
+        >>> crud_client = AirflowCrudApiClient(auth_provider, cache=cache)
+        >>> crud_client.list_airflow_jobs(workspace_id)  # network
+        >>> crud_client.list_airflow_jobs(workspace_id)  # served from cache
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_jitter: float = 0.1):
+        """
+        Initialize the ResponseCache.
+
+        Args:
+            max_entries: Maximum number of entries kept; least recently used entries are evicted first
+            ttl_jitter: Maximum fraction of the TTL randomly added to each entry's lifetime
+        """
+        self.max_entries = max_entries
+        self.ttl_jitter = ttl_jitter
+        self._entries: "collections.OrderedDict[t.Hashable, t.Tuple[ApiResponse, float, t.FrozenSet[str]]]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: t.Hashable) -> "t.Optional[ApiResponse]":
+        """Get a cached response if present and not expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= time.monotonic():
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def get_stale(self, key: t.Hashable) -> "t.Optional[ApiResponse]":
+        """Get a cached response even if it has expired (e.g. to revalidate it with its ETag)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry[0] if entry is not None else None
+
+    def set(self, key: t.Hashable, response: "ApiResponse", ttl: float, tags: t.Iterable[str] = ()) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Cache key
+            response: Response to cache
+            ttl: Time to live in seconds
+            tags: Tags used for invalidation with invalidate_tag()
+        """
+        expires_at = time.monotonic() + ttl * (1 + random.uniform(0, self.ttl_jitter))
+        with self._lock:
+            self._entries[key] = (response, expires_at, frozenset(tags))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: t.Hashable) -> None:
+        """Remove a single entry."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_tag(self, tag: str) -> None:
+        """Remove all entries carrying the given tag."""
+        with self._lock:
+            for key in [k for k, entry in self._entries.items() if tag in entry[2]]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -5,42 +5,47 @@ This script shows how to use all API clients with Config.setup() from a configur
 All examples use config.ini in the sample folder.
 """
 
+import functools
 import logging
 import os
+import types
 import typing as t
-import json
-import base64
 from pathlib import Path
 from fabric.airflow.client.config import Config, ConfigurationError
+from fabric.airflow.client.fabric_crud_model import FabricItemDefinition
 from fabric.airflow.client.api_exceptions import (
     ValidationError, AuthenticationError, ForbiddenError, 
     NotFoundError, ClientError, ServerError
 )
 import random
 
+try:
+    # Faster parsing when the optional 'fast' extra is installed
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Get the config file path relative to this script
 SAMPLE_DIR = Path(__file__).parent
+SAMPLE_DAG_PATH = SAMPLE_DIR / "sample_dag.py"
+UPDATE_SPEC_PATH = SAMPLE_DIR / "update_airflow_definition.json"
 CONFIG_FILE = os.getenv('CONFIG_FILE_PATH') 
 
-if not CONFIG_FILE:
-    print("❌ ERROR: CONFIG_FILE_PATH environment variable is not set!")
-    print("   Please set it to point to your config.ini file:")
-    print("   PowerShell: $env:CONFIG_FILE_PATH = 'c:\\src\\ApiTest\\config.ini'")
-    print("   Or add it to .env file in the workspace root")
-    exit(1)
-
 # Global config instance
 config: Config
 
+# Generator for display-name suffixes; seeded from the OS so reruns don't produce clashing names
+_suffix_rng = random.Random()
+
 def initialize_config():
     """Initialize Config from config.ini file"""
     global config
     try:
-        assert CONFIG_FILE is not None, "CONFIG_FILE should be set (checked above)"
+        assert CONFIG_FILE is not None, "CONFIG_FILE should be set (checked in main)"
         # Load config from ApiTest environment by default
         config = Config.from_file(CONFIG_FILE, 'ApiTest')
         logger.info(f"✅ Configuration loaded from {CONFIG_FILE} [ApiTest environment]")
@@ -63,23 +68,23 @@ def example_files_api():
         files_client = config.files_client()
         
         # Use sample DAG from the same folder
-        dag_file = SAMPLE_DIR / "sample_dag.py"
+        dag_file = SAMPLE_DAG_PATH
         
         if dag_file.exists():
-            # Upload DAG file
-            with open(dag_file, 'r', encoding='utf-8') as f:
-                dag_content = f.read()
+            # Upload DAG file (read once as bytes and reused for the update below)
+            dag_bytes = dag_file.read_bytes()
             
             logger.info("Uploading sample DAG file...")
-            response = files_client.create_or_update_file("dags/sample_dag.py", dag_content)
+            response = files_client.create_or_update_file("dags/sample_dag.py", dag_bytes)
             logger.info(f"✅ DAG uploaded - Status: {response.status}")
             
             # List DAG files
             logger.info("Listing DAG files...")
             response = files_client.list_files(root_path="dags")
-            logger.info(f"✅ Found {len(response.body.get('files', []))} DAG files")
-            for file in response.body.get('files', [])[:5]:  # Show first 5
-                logger.info(f"   - {file.get('filePath')} ({file.get('sizeInBytes', 0)} bytes)")
+            files = response.body.get('files') or []
+            logger.info("✅ Found %d DAG files", len(files))
+            for file in files[:5]:  # Show first 5
+                logger.info("   - %s (%s bytes)", file.get('filePath'), file.get('sizeInBytes', 0))
             
             # Download DAG file
             logger.info("Downloading DAG file...")
@@ -88,7 +93,7 @@ def example_files_api():
             
             # Update DAG file (add a comment)
             logger.info("Updating DAG file...")
-            updated_content = "# This file was updated via API\n" + dag_content
+            updated_content = b"# This file was updated via API\n" + dag_bytes
             response = files_client.create_or_update_file("dags/sample_dag.py", updated_content)
             logger.info(f"✅ DAG updated - Status: {response.status}")
             
@@ -96,8 +101,8 @@ def example_files_api():
             logger.info("Listing root directory...")
             response = files_client.list_files(root_path="/")
             logger.info(f"✅ Root directories:")
-            for item in response.body.get('files', []):
-                logger.info(f"   - {item.get('filePath')}")
+            for item in response.body.get('files') or []:
+                logger.info("   - %s", item.get('filePath'))
             
             # Delete DAG file (commented out to keep the file)
             # logger.info("Deleting DAG file...")
@@ -118,18 +123,13 @@ def example_control_plane_api():
     print("="*60)
     
     try:
-        from fabric.airflow.client.fabric_control_plane_model import (
-            AirflowPoolTemplate, 
-            WorkerScalability
-        )
-        
         cp_client = config.control_plane_client()
         
         # Get workspace settings
         logger.info("Getting workspace settings...")
         settings = cp_client.get_workspace_settings()
         logger.info(f"✅ Workspace settings retrieved")
-        logger.info(f"   Settings: {settings}")
+        logger.info("   Settings: %s", settings)
         
         # Create pool template (commented out to avoid creating resources)
         # logger.info("Creating pool template...")
@@ -163,7 +163,7 @@ def example_airflow_native_api():
             dags = response.body.get('dags', [])
             logger.info(f"✅ Found {len(dags)} DAGs")
             for dag in dags[:5]:  # Show first 5
-                logger.info(f"   - {dag.get('dag_id')}: {dag.get('is_active')}")
+                logger.info("   - %s: %s", dag.get('dag_id'), dag.get('is_active'))
         
         # Note: Other operations like trigger_dag_run would require an existing DAGclea
         # response = native_client.trigger_dag_run("my_dag_id")
@@ -212,24 +212,11 @@ def fetch_and_update_definition():
         
         # Update the definition
         logger.info("Updating Airflow job definition...")
-        try:
-            # Log the outgoing request body parts (decode InlineBase64 payloads for inspection)
-            outgoing = definition.to_dict()
-            parts = outgoing.get('definition', {}).get('parts', [])
-            for p in parts:
-                path = p.get('path')
-                payload = p.get('payload')
-                ptype = p.get('payloadType')
-                if ptype == 'InlineBase64' and isinstance(payload, str):
-                    try:
-                        decoded = base64.b64decode(payload).decode('utf-8')
-                        logger.info(f"Outgoing part '{path}': {decoded}")
-                    except Exception:
-                        logger.info(f"Outgoing part '{path}': <unable to decode payload>")
-                else:
-                    logger.info(f"Outgoing part '{path}': {payload}")
-        except Exception:
-            logger.info("Could not serialize outgoing payload for debug")
+        if logger.isEnabledFor(logging.DEBUG):
+            # Log the outgoing parts. The parts keep their decoded payloads (the Airflow part holds the
+            # dict parsed by as_json()), so there is no need to base64-encode and decode them again here.
+            for part in definition.parts:
+                logger.debug("Outgoing part '%s': %s", part.path, part.payload)
 
         crud_client.update_airflow_job_definition(
             workspace_id=workspace_id,
@@ -244,8 +231,67 @@ def fetch_and_update_definition():
         raise
 
 
+@functools.lru_cache(maxsize=1)
+def _load_update_spec() -> t.Mapping[str, t.Any]:
+    """
+    Load the requested airflowProperties updates from update_airflow_definition.json.
+    
+    The file is read, parsed and normalized only once; call _load_update_spec.cache_clear()
+    to pick up edits. The result is read-only: the dict sections are mapping proxies and the
+    list sections are tuples.
+    
+    Returns:
+        Mapping: properties.typeProperties.airflowProperties of the update file ({} if missing or invalid)
+    """
+    update_file = UPDATE_SPEC_PATH
+    if not update_file.exists():
+        return types.MappingProxyType({})
+    try:
+        upd = _json_loads(update_file.read_bytes())
+        requested = upd.get('properties', {}).get('typeProperties', {}).get('airflowProperties', {}) or {}
+    except Exception as e:
+        logger.error(f"Failed to load update file: {e}")
+        return types.MappingProxyType({})
+    if not isinstance(requested, dict):
+        return types.MappingProxyType({})
+
+    # If the update file accidentally nests 'airflowConfigurationOverrides' under itself, unwrap one level
+    # BUT only unwrap when the outer dict contains only that nested key. This avoids discarding sibling keys
+    # such as environmentVariables which should remain available.
+    ao = requested.get('airflowConfigurationOverrides')
+    if isinstance(ao, dict) and 'airflowConfigurationOverrides' in ao and len(ao) == 1:
+        requested['airflowConfigurationOverrides'] = ao.get('airflowConfigurationOverrides') or {}
+
+    # If the user placed environmentVariables or airflowRequirements inside airflowConfigurationOverrides,
+    # lift them to top-level requested so they will be applied to airflow_props.
+    if isinstance(ao, dict):
+        if 'environmentVariables' in ao and 'environmentVariables' not in requested:
+            requested['environmentVariables'] = ao.get('environmentVariables')
+        if 'airflowRequirements' in ao and 'airflowRequirements' not in requested:
+            requested['airflowRequirements'] = ao.get('airflowRequirements')
+
+    # Freeze the sections _modify_definition() applies
+    for key in ('airflowConfigurationOverrides', 'environmentVariables'):
+        if key in requested:
+            requested[key] = types.MappingProxyType(dict(requested[key] or {}))
+    for key in ('airflowRequirements', 'secrets'):
+        if key in requested:
+            try:
+                requested[key] = tuple(requested[key] or ())
+            except TypeError:
+                requested[key] = ()
+    return types.MappingProxyType(requested)
+
+
 def _modify_definition(definition):
     """Modify the Airflow job definition"""
+    # Requested updates from the sample file (read and normalized once per process).
+    # Without any, leave the definition untouched instead of parsing the Airflow part for nothing.
+    requested = _load_update_spec()
+    if not requested:
+        logger.info("No updates requested in update_airflow_definition.json; definition left unchanged")
+        return
+
     # Get current Airflow configuration part
     airflow_part = definition.get_airflow_definition()
     if airflow_part:
@@ -253,67 +299,36 @@ def _modify_definition(definition):
         airflow_config = airflow_part.as_json()
         
         if airflow_config:
-            # Navigate to airflowProperties (properties.typeProperties.airflowProperties)
-            type_props = airflow_config.get('properties', {}).get('typeProperties', {})
-            airflow_props = type_props.get('airflowProperties', {})
-            # Load requested updates from sample file (if present)
-            update_file = SAMPLE_DIR / "update_airflow_definition.json"
-            requested = {}
-            if update_file.exists():
-                try:
-                    with open(update_file, 'r', encoding='utf-8') as f:
-                        upd = json.load(f)
-                        requested = upd.get('properties', {}).get('typeProperties', {}).get('airflowProperties', {}) or {}
-                except Exception as e:
-                    logger.error(f"Failed to load update file: {e}")
-
-            # If the update file accidentally nests 'airflowConfigurationOverrides' under itself, unwrap one level
-            # BUT only unwrap when the outer dict contains only that nested key. This avoids discarding sibling keys
-            # such as environmentVariables which should remain available.
-            if isinstance(requested, dict):
-                ao = requested.get('airflowConfigurationOverrides')
-                if isinstance(ao, dict) and 'airflowConfigurationOverrides' in ao and len(ao) == 1:
-                    requested['airflowConfigurationOverrides'] = ao.get('airflowConfigurationOverrides') or {}
-
-                # If the user placed environmentVariables or airflowRequirements inside airflowConfigurationOverrides,
-                # lift them to top-level requested so they will be applied to airflow_props.
-                if isinstance(ao, dict):
-                    if 'environmentVariables' in ao and 'environmentVariables' not in requested:
-                        requested['environmentVariables'] = ao.get('environmentVariables')
-                    if 'airflowRequirements' in ao and 'airflowRequirements' not in requested:
-                        requested['airflowRequirements'] = ao.get('airflowRequirements')
+            # Navigate to airflowProperties (properties.typeProperties.airflowProperties); missing levels
+            # are created in place so the changes below always land in airflow_config
+            type_props = airflow_config.setdefault('properties', {}).setdefault('typeProperties', {})
+            airflow_props = type_props.setdefault('airflowProperties', {})
 
             # Apply values from update file for allowed keys
             # airflowConfigurationOverrides (dict), environmentVariables (dict), airflowRequirements (list)
-            if 'airflowConfigurationOverrides' in requested:
-                if 'airflowConfigurationOverrides' not in airflow_props or not isinstance(airflow_props.get('airflowConfigurationOverrides'), dict):
-                    airflow_props['airflowConfigurationOverrides'] = {}
-                # shallow merge from requested
-                for k, v in (requested.get('airflowConfigurationOverrides') or {}).items():
-                    airflow_props['airflowConfigurationOverrides'][k] = v
-
-            if 'environmentVariables' in requested:
-                if 'environmentVariables' not in airflow_props or not isinstance(airflow_props.get('environmentVariables'), dict):
-                    airflow_props['environmentVariables'] = {}
-                for k, v in (requested.get('environmentVariables') or {}).items():
-                    airflow_props['environmentVariables'][k] = v
-
-            if 'airflowRequirements' in requested:
-                airflow_props['airflowRequirements'] = list(requested.get('airflowRequirements') or [])
+            for key in ('airflowConfigurationOverrides', 'environmentVariables'):
+                if key in requested:
+                    # shallow merge from requested into the existing dict (replaced if it isn't a dict)
+                    target = airflow_props.setdefault(key, {})
+                    if not isinstance(target, dict):
+                        target = airflow_props[key] = {}
+                    target.update(requested[key])
+
+            # Requirements are added to the existing ones (order kept, duplicates dropped)
+            req_list = requested.get('airflowRequirements')
+            if req_list:
+                existing = airflow_props.get('airflowRequirements') or []
+                airflow_props['airflowRequirements'] = list(dict.fromkeys([*existing, *req_list]))
 
             # If user provided secrets in the update file, copy them into airflowProperties
             # This mirrors behavior when creating a job with secrets present.
-            if 'secrets' in requested:
-                # ensure secrets is a list
-                try:
-                    secrets_list = list(requested.get('secrets') or [])
-                except Exception:
-                    secrets_list = []
-                if secrets_list:
-                    airflow_props['secrets'] = secrets_list
+            if requested.get('secrets'):
+                airflow_props['secrets'] = list(requested['secrets'])
 
-            # Update the part's payload with modified configuration
-            airflow_part.payload = airflow_config
+            # as_json() returns the part's own payload dict, so it was modified in place; only
+            # assign if an implementation handed back a copy
+            if airflow_part.payload is not airflow_config:
+                airflow_part.payload = airflow_config
             logger.info(f"✅ Applied updates from update_airflow_definition.json to airflowProperties")
 
 
@@ -362,10 +377,6 @@ def example_crud_api():
     print("="*60)
     
     try:
-        from fabric.airflow.client.fabric_crud_model import (
-            AirflowItem, FabricItemDefinition
-        )
-        
         crud_client = config.crud_client()
         workspace_id = config.workspace_id
         
@@ -385,7 +396,7 @@ def example_crud_api():
         
         # Example: Create Airflow job with definition and DAGs
         logger.info("Creating Airflow job with definition...")
-        suffix = random.randint(1000, 9999)
+        suffix = _suffix_rng.randrange(1000, 10000)
         definition = FabricItemDefinition(
             displayName=f"ExampleWithDefinition-{suffix}",
             airflow_definition_file="C:\\src\\ApiTest\\src\\sample\\airflow_definition.json",
@@ -438,7 +449,15 @@ def example_error_handling():
         logger.error(f"❌ Unexpected error: {ex}")
 
 
-if __name__ == "__main__":
+def main():
+    """Run the examples (configuration is only checked and loaded here, not at import time)"""
+    if not CONFIG_FILE:
+        print("❌ ERROR: CONFIG_FILE_PATH environment variable is not set!")
+        print("   Please set it to point to your config.ini file:")
+        print("   PowerShell: $env:CONFIG_FILE_PATH = 'c:\\src\\ApiTest\\config.ini'")
+        print("   Or add it to .env file in the workspace root")
+        exit(1)
+    
     print("="*60)
     print("FABRIC AIRFLOW API CLIENT EXAMPLES")
     print("="*60)
@@ -464,3 +483,7 @@ if __name__ == "__main__":
     print(f"Note: Some operations are commented out to avoid creating resources.")
     print(f"      Edit {CONFIG_FILE} with your credentials to run these examples.")
     print("="*60)
+
+
+if __name__ == "__main__":
+    main()
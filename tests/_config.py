@@ -0,0 +1,27 @@
+"""
+Lazily loaded test configuration.
+
+The config file named by CONFIG_FILE_PATH is parsed the first time a test class asks for it, so collecting
+or filtering tests never reads it, and test classes are skipped instead of failing when it is not set.
+"""
+import functools
+import os
+import unittest
+
+from fabric.airflow.client.config import Config
+
+
+@functools.lru_cache(maxsize=None)
+def get_config() -> Config:
+    """
+    Load the TEST section of the config file named by CONFIG_FILE_PATH (once per process).
+
+    Set environment variable: $env:CONFIG_FILE_PATH = "c:\\src\\ApiTest\\config.ini"
+
+    Raises:
+        unittest.SkipTest: If CONFIG_FILE_PATH is not set
+    """
+    config_file = os.getenv('CONFIG_FILE_PATH')
+    if config_file is None:
+        raise unittest.SkipTest("CONFIG_FILE_PATH environment variable must be set")
+    return Config.from_file(config_file, 'TEST')
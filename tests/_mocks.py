@@ -0,0 +1,45 @@
+"""
+Stand-ins for the HTTP session and auth provider used by the mocked unit tests.
+
+Clients are created with session=self.session, so requests are answered by the fake responses set on
+self.session.request and never reach the network.
+"""
+import json
+import typing as t
+from unittest import mock
+
+
+def fake_response(status: int = 200, content: bytes = b"", headers: t.Optional[dict] = None) -> mock.Mock:
+    """Build a stand-in for requests.Response with the attributes the client reads"""
+    response = mock.Mock()
+    response.status_code = status
+    response.headers = dict(headers or {})
+    response.content = content
+    response.text = content.decode("utf-8", errors="replace")
+    response.iter_content.side_effect = lambda chunk_size: iter([content])
+    return response
+
+
+def json_response(status: int = 200, body: t.Any = None, headers: t.Optional[dict] = None) -> mock.Mock:
+    """Build a stand-in for a requests.Response carrying body as JSON (no content if body is None)"""
+    content = json.dumps(body).encode("utf-8") if body is not None else b""
+    return fake_response(status, content, {"Content-Type": "application/json", **(headers or {})})
+
+
+class MockedSessionMixin:
+    """
+    Test case mixin providing a mocked requests session and an auth provider returning "token".
+
+    Subclasses that override setUp must call super().setUp() first.
+    """
+
+    def setUp(self):
+        """Set up the mocked session and auth provider"""
+        super().setUp()
+        self.session = mock.Mock()
+        self.auth_provider = mock.Mock()
+        self.auth_provider.get_token.return_value = "token"
+
+    def sent(self, call_index: int = -1) -> dict:
+        """Keyword arguments of a request sent through the session (the last one by default)"""
+        return self.session.request.call_args_list[call_index].kwargs
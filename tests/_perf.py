@@ -0,0 +1,28 @@
+"""
+Latency budgets for the integration tests.
+
+Set TEST_LATENCY_SCALE to stretch every budget (e.g. "2" on a slow network) or to "0" to disable them.
+"""
+import os
+import time
+from contextlib import contextmanager
+
+LATENCY_SCALE = float(os.getenv('TEST_LATENCY_SCALE', '1'))
+
+
+@contextmanager
+def budget(seconds: float):
+    """
+    Fail if the wrapped block takes longer than the given number of seconds.
+
+    Usable as a context manager or as a test method decorator.
+
+    Args:
+        seconds: Allowed wall-clock time before scaling by TEST_LATENCY_SCALE
+    """
+    start = time.perf_counter()
+    yield
+    elapsed = time.perf_counter() - start
+    limit = seconds * LATENCY_SCALE
+    if limit > 0 and elapsed > limit:
+        raise AssertionError(f"Exceeded latency budget: {elapsed:.2f}s > {limit:.2f}s")
@@ -1,23 +1,22 @@
-import os
 import unittest
 import json
 
+import pytest
+
 from fabric.airflow.client.api_exceptions import APIError
 from fabric.airflow.client.airflow_api_client import AirflowApiClient
-from fabric.airflow.client.config import Config
+from tests._config import get_config
 
-# Initialize Config from environment variable CONFIG_FILE_PATH
-# Set environment variable: $env:CONFIG_FILE_PATH = "c:\src\ApiTest\config.ini"
-config_file = os.getenv('CONFIG_FILE_PATH')
-assert config_file is not None, "CONFIG_FILE_PATH environment variable must be set"
-config = Config.from_file(config_file, 'TEST')
+# Every test in this module talks to a live workspace; run them with: pytest -m integration
+pytestmark = pytest.mark.integration
 
 class TestAirflowNativeApiIntegration(unittest.TestCase):
     """Integration test cases for Airflow Native API client operations"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.native_client = config.airflow_native_client()
+    @classmethod
+    def setUpClass(cls):
+        """Set up test class with the native API client"""
+        cls.native_client = get_config().airflow_native_client()
 
     def test_native_client_type(self):
         """Test that ConfigClient returns correct native client type"""
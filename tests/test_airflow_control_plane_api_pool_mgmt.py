@@ -1,8 +1,13 @@
+import contextlib
+import logging
 import os
+import typing as t
 import unittest
 import uuid
 
-from fabric.airflow.client.config import Config
+import pytest
+
+from fabric.airflow.client.api_exceptions import APIError, NotFoundError
 from fabric.airflow.client.fabric_control_plane_api_client import FabricControlPlaneApiClient
 from fabric.airflow.client.fabric_control_plane_model import (
     AirflowPoolTemplate,
@@ -10,12 +15,16 @@ from fabric.airflow.client.fabric_control_plane_model import (
     AirflowWorkspaceSettings,
     WorkerScalability,
 )
+from tests._perf import budget
+from tests._config import get_config
+
+# Every test in this module talks to a live workspace; run them with: pytest -m integration
+pytestmark = pytest.mark.integration
 
-# Initialize Config from environment variable CONFIG_FILE_PATH
-# Set environment variable: $env:CONFIG_FILE_PATH = "c:\src\ApiTest\config.ini"
-config_file = os.getenv('CONFIG_FILE_PATH')
-assert config_file is not None, "CONFIG_FILE_PATH environment variable must be set"
-config = Config.from_file(config_file, 'TEST')
+logger = logging.getLogger(__name__)
+
+# Worker id set by pytest-xdist (gw0, gw1, ...) so parallel workers never share pool names
+worker_id = os.getenv('PYTEST_XDIST_WORKER', 'main')
 
 class TestAirflowControlPlaneApiIntegration(unittest.TestCase):
     """Integration tests for Airflow Control Plane API"""
@@ -23,8 +32,17 @@ class TestAirflowControlPlaneApiIntegration(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Set up test class with API client"""
+        config = get_config()
         cls.client: FabricControlPlaneApiClient = config.control_plane_client()
         cls.workspace_id = config.workspace_id
+        cls._initial_settings = None
+
+    def _get_initial_workspace_settings(self) -> AirflowWorkspaceSettings:
+        """Fetch the workspace settings as they were before any test changed them (read once per class)"""
+        cls = type(self)
+        if cls._initial_settings is None:
+            cls._initial_settings = self.client.get_workspace_settings()
+        return cls._initial_settings
 
     def _create_pool_template(self, pool_name: str, min_nodes: int, max_nodes: int) -> AirflowPoolTemplate:
         """Create a pool template with specified configuration"""
@@ -36,28 +54,27 @@ class TestAirflowControlPlaneApiIntegration(unittest.TestCase):
             # Optional read-only fields are omitted - will be set by server
         )
 
-    def _test_pool_lifecycle(self, pool_template: AirflowPoolTemplate, pool_type: str) -> None:
+    def _create_and_validate(self, pool_template: AirflowPoolTemplate, pool_type: str) -> str:
         """
-        Test complete lifecycle for a pool template:
-        1. Create pool template
-        2. Fetch and validate pool configuration
-        3. List pools and validate presence
-        4. Delete pool template
+        Create a pool template, then fetch it and validate its configuration.
         
         Args:
             pool_template: AirflowPoolTemplate object with pool configuration
             pool_type: Description of pool type for logging
+            
+        Returns:
+            str: ID of the created pool template
         """
         # Step 1: Create pool template
-        print(f"Step 1: Creating {pool_type}...")
+        logger.info("Step 1: Creating %s...", pool_type)
         
         pool_id = self.client.create_pool_template(pool_template)
         self.assertIsNotNone(pool_id, "Pool ID should be returned from API client")
         self.assertTrue(len(pool_id) > 0, "Pool ID should not be empty")
-        print(f"Created {pool_type}: {pool_template.poolTemplateName} (ID: {pool_id})")
+        logger.info("Created %s: %s (ID: %s)", pool_type, pool_template.poolTemplateName, pool_id)
         
         # Step 2: Fetch and validate pool configuration
-        print(f"Step 2: Fetching and validating {pool_type} configuration...")
+        logger.info("Step 2: Fetching and validating %s configuration...", pool_type)
         fetched_pool : AirflowPoolTemplate = self.client.get_pool_template(pool_id)
         self.assertIsNotNone(fetched_pool, "Fetched pool should not be None")
         
@@ -80,14 +97,20 @@ class TestAirflowControlPlaneApiIntegration(unittest.TestCase):
         self.assertIsNotNone(fetched_pool.poolTemplateId)
         if fetched_pool.poolTemplateId:
             self.assertTrue(len(fetched_pool.poolTemplateId) > 0)
-        print(f"Validated {pool_type} configuration matches expected values")
-        
-        # Step 3: List pools and validate presence
-        print(f"Step 3: Listing pools and validating {pool_type} presence...")
-        pools_list_obj = self.client.list_pool_templates_parsed()
-        self.assertIsNotNone(pools_list_obj)
-        self.assertIsInstance(pools_list_obj, AirflowPoolsTemplate)
+        logger.info("Validated %s configuration matches expected values", pool_type)
+        return pool_id
+
+    def _assert_present_in(self, pools_list_obj: AirflowPoolsTemplate, pool_template: AirflowPoolTemplate,
+                           pool_id: str, pool_type: str) -> None:
+        """
+        Validate that a pool template appears in a pool listing with the expected configuration.
         
+        Args:
+            pools_list_obj: Parsed pool listing
+            pool_template: AirflowPoolTemplate object the pool was created from
+            pool_id: ID of the created pool template
+            pool_type: Description of pool type for logging
+        """
         pool_names = [pool.poolTemplateName for pool in pools_list_obj.poolTemplates]
         self.assertIn(pool_template.poolTemplateName, pool_names, 
                      f"{pool_type} {pool_template.poolTemplateName} not found in pool list")
@@ -103,44 +126,83 @@ class TestAirflowControlPlaneApiIntegration(unittest.TestCase):
                 self.assertEqual(found_pool.workerScalability.minNodeCount, pool_template.workerScalability.minNodeCount)
                 self.assertEqual(found_pool.workerScalability.maxNodeCount, pool_template.workerScalability.maxNodeCount)
 
-        print(f"{pool_type} found in list with correct configuration")
-        
-        # Step 4: Delete pool template
-        print(f"Step 4: Deleting {pool_type}...")
+        logger.info("%s found in list with correct configuration", pool_type)
+
+    def _delete(self, pool_id: str, pool_type: str) -> None:
+        """Delete a pool template and validate the response"""
         delete_response = self.client.delete_pool_template(pool_id)
         self.assertIsNotNone(delete_response)
         self.assertIn(delete_response.status, [200, 204])  # Success or No Content
-        print(f"Successfully deleted {pool_type}: {pool_id}")
+        logger.info("Successfully deleted %s: %s", pool_type, pool_id)
+
+    def _delete_quietly(self, pool_id: str) -> None:
+        """Delete a pool template left behind by a failed test, ignoring errors"""
+        try:
+            self.client.delete_pool_template(pool_id)
+            logger.info("Cleaned up pool after error: %s", pool_id)
+        except APIError:
+            pass
+
+    def _test_pool_lifecycle(self, pools: t.List[t.Tuple[AirflowPoolTemplate, str]]) -> None:
+        """
+        Test complete lifecycle for a batch of pool templates:
+        1. Create every pool template
+        2. Fetch and validate each pool configuration
+        3. List pools once and validate the presence of every pool
+        4. Delete every pool template and validate that each one is gone
+        
+        Pools that were created are deleted even if a later step fails.
         
-        # Verify pool is removed from list
-        pools_list_after_delete = self.client.list_pool_templates_parsed()
-        pool_names_after = [pool.poolTemplateName for pool in pools_list_after_delete.poolTemplates]
-        self.assertNotIn(pool_template.poolTemplateName, pool_names_after,
-                       f"{pool_type} {pool_template.poolTemplateName} should be removed from list")
-        print(f"Confirmed {pool_type} removed from list after deletion\n")
+        Args:
+            pools: (pool template, description of pool type for logging) pairs
+        """
+        # Latency budget of 15 seconds per pool in the batch
+        with budget(15.0 * len(pools)):
+            with contextlib.ExitStack() as cleanup:
+                pool_ids = []
+                for pool_template, pool_type in pools:
+                    pool_id = self._create_and_validate(pool_template, pool_type)
+                    cleanup.callback(self._delete_quietly, pool_id)
+                    pool_ids.append(pool_id)
+            
+                # Step 3: List pools once and validate presence of every pool
+                logger.info("Step 3: Listing pools and validating presence...")
+                pools_list_obj = self.client.list_pool_templates_parsed()
+                self.assertIsNotNone(pools_list_obj)
+                self.assertIsInstance(pools_list_obj, AirflowPoolsTemplate)
+                for (pool_template, pool_type), pool_id in zip(pools, pool_ids):
+                    self._assert_present_in(pools_list_obj, pool_template, pool_id, pool_type)
+            
+                # Step 4: Delete pool templates
+                logger.info("Step 4: Deleting pools...")
+                for (pool_template, pool_type), pool_id in zip(pools, pool_ids):
+                    self._delete(pool_id, pool_type)
+                cleanup.pop_all()
+        
+            # Verify pools are gone (targeted lookups instead of listing every pool)
+            for (pool_template, pool_type), pool_id in zip(pools, pool_ids):
+                with self.assertRaises(NotFoundError,
+                                       msg=f"{pool_type} {pool_template.poolTemplateName} should be removed"):
+                    self.client.get_pool_template(pool_id)
+                logger.info("Confirmed %s no longer exists after deletion", pool_type)
 
     def test_00_pool_template_minimal_config(self):
         """
         Test creating a pool with minimal configuration (required fields only)
         Server-side optional fields like shutdownPolicy, availabilityZones are omitted
         """
-        print("=" * 80)
-        print("Testing pool template with minimal configuration")
-        print("=" * 80)
+        logger.info("Testing pool template with minimal configuration")
         
         # Create pool with only required fields (poolTemplateName, nodeSize, workerScalability, apacheAirflowJobVersion)
         # Omit server-side optional fields (shutdownPolicy, availabilityZones)
         minimal_template = AirflowPoolTemplate(
-            poolTemplateName=f"test-minimal-{str(uuid.uuid4())[:8]}",
+            poolTemplateName=f"test-minimal-{str(uuid.uuid4())[:8]}-{worker_id}",
             nodeSize="Small",
             workerScalability=WorkerScalability(minNodeCount=2, maxNodeCount=2),
             apacheAirflowJobVersion="1.0.0"
             # shutdownPolicy and availabilityZones omitted - should use server defaults
         )
-        self._test_pool_lifecycle(
-            pool_template=minimal_template,
-            pool_type="minimal config pool [2,2]"
-        )
+        self._test_pool_lifecycle([(minimal_template, "minimal config pool [2,2]")])
                   
 
 
@@ -149,47 +211,36 @@ class TestAirflowControlPlaneApiIntegration(unittest.TestCase):
         Comprehensive test for pool template lifecycle across different scaling configurations:
         - Fixed scale pool [6,6] - no autoscaling
         - Auto scale pool [6,7] - autoscaling enabled
-        - No scale pool [1,1] - single node
         
-        For each pool type, tests:
-        1. Create pool template
-        2. Fetch and validate pool configuration
-        3. List pools and validate presence
-        4. Delete pool template
+        All pools are created up front and validated against a single pool listing:
+        1. Create pool templates
+        2. Fetch and validate each pool configuration
+        3. List pools once and validate presence
+        4. Delete pool templates and validate absence with a get_pool_template lookup per pool
         """
         try:
             # Generate unique pool names for this test run
-            test_run_id = str(uuid.uuid4())[:8]
+            test_run_id = f"{str(uuid.uuid4())[:8]}-{worker_id}"
             
-            print("=" * 80)
-            print("Testing Fixed Scale Pool [6,6]")
-            print("=" * 80)
+            logger.info("Testing Fixed Scale Pool [6,6] and Auto Scale Pool [6,7]")
             fixed_scale_template = self._create_pool_template(
                 pool_name=f"test-pool-fixed-scale-{test_run_id}",
                 min_nodes=6,
                 max_nodes=6
             )
-            self._test_pool_lifecycle(
-                pool_template=fixed_scale_template,
-                pool_type="fixed scale pool [6,6]"
-            )
-            
-            print("=" * 80)
-            print("Testing Auto Scale Pool [6,7]")
-            print("=" * 80)
             auto_scale_template = self._create_pool_template(
                 pool_name=f"test-pool-auto-scale-{test_run_id}",
                 min_nodes=6,
                 max_nodes=7
             )
-            self._test_pool_lifecycle(
-                pool_template=auto_scale_template,
-                pool_type="auto scale pool [6,7]"
-            )
+            self._test_pool_lifecycle([
+                (fixed_scale_template, "fixed scale pool [6,6]"),
+                (auto_scale_template, "auto scale pool [6,7]"),
+            ])
                       
         except Exception as e:
             if "404" in str(e):
-                print(f"[WARNING] Control Plane API not available: {e}")
+                logger.warning("Control Plane API not available: %s", e)
                 self.skipTest("Control Plane API endpoints not available in this environment")
             else:
                 raise
@@ -206,14 +257,14 @@ class TestAirflowControlPlaneApiIntegration(unittest.TestCase):
         """
         try:
             # Step 1: Check current default pool (should be starter pool with GUID 0000...)
-            print("Step 1: Checking initial default pool...")
-            settings = self.client.get_workspace_settings()
+            logger.info("Step 1: Checking initial default pool...")
+            settings = self._get_initial_workspace_settings()
             self.assertIsNotNone(settings)
             self.assertIsInstance(settings, AirflowWorkspaceSettings)
             
             # Store the original default pool for restoration later
             original_default_pool = settings.defaultPoolTemplateId
-            print(f"Initial default pool: {original_default_pool}")
+            logger.info("Initial default pool: %s", original_default_pool)
             
             # Verify it's the starter pool (should start with '0000' or be empty/None for starter)
             if original_default_pool:
@@ -221,11 +272,11 @@ class TestAirflowControlPlaneApiIntegration(unittest.TestCase):
                     original_default_pool.startswith('0000'),
                     f"Expected starter pool (0000...), but got: {original_default_pool}"
                 )
-            print("Confirmed initial default is starter pool")
+            logger.info("Confirmed initial default is starter pool")
             
             # Step 2: Create a temporary pool for testing
-            print("Step 2: Creating temporary pool for default testing...")
-            temp_pool_name = f"test-default-pool-{str(uuid.uuid4())[:8]}"
+            logger.info("Step 2: Creating temporary pool for default testing...")
+            temp_pool_name = f"test-default-pool-{str(uuid.uuid4())[:8]}-{worker_id}"
             temp_pool_template = self._create_pool_template(
                 pool_name=temp_pool_name,
                 min_nodes=2,
@@ -234,19 +285,19 @@ class TestAirflowControlPlaneApiIntegration(unittest.TestCase):
             
             pool_id = self.client.create_pool_template(temp_pool_template)
             self.assertIsNotNone(pool_id, "Pool ID should be returned from API client")
-            print(f"Created temporary pool: {temp_pool_name} (ID: {pool_id})")
+            logger.info("Created temporary pool: %s (ID: %s)", temp_pool_name, pool_id)
             
             try:
                 # Step 3: Make the pool the default
-                print("Step 3: Setting new default pool...")
+                logger.info("Step 3: Setting new default pool...")
                 response = self.client.patch_workspace_settings(
                     AirflowWorkspaceSettings(defaultPoolTemplateId=pool_id))
                 self.assertIsNotNone(response)
                 self.assertIn(response.status, [200, 204])  # Success or No Content
-                print(f"Set {temp_pool_name} (ID: {pool_id}) as default pool")
+                logger.info("Set %s (ID: %s) as default pool", temp_pool_name, pool_id)
                 
                 # Step 4: Check default pool changed
-                print("Step 4: Verifying default pool changed...")
+                logger.info("Step 4: Verifying default pool changed...")
                 settings = self.client.get_workspace_settings()                
                 self.assertIsNotNone(settings)
                 self.assertIsInstance(settings, AirflowWorkspaceSettings)
@@ -254,17 +305,17 @@ class TestAirflowControlPlaneApiIntegration(unittest.TestCase):
                 self.assertEqual(
                     current_default, pool_id, 
                     f"Default pool should be {pool_id}, but got {current_default}")
-                print(f"Verified new default pool ID: {current_default}")
+                logger.info("Verified new default pool ID: %s", current_default)
                 
                 # Step 5: Delete the pool that's currently the default
-                print("Step 5: Deleting the default pool...")
+                logger.info("Step 5: Deleting the default pool...")
                 delete_response = self.client.delete_pool_template(pool_id)                
                 self.assertIsNotNone(delete_response)
                 self.assertIn(delete_response.status, [200, 204])  # Success or No Content
-                print(f"Deleted pool: {pool_id}")
+                logger.info("Deleted pool: %s", pool_id)
                 
                 # Step 6: Check it reverted to 0000...
-                print("Step 6: Verifying reversion to starter pool...")
+                logger.info("Step 6: Verifying reversion to starter pool...")
                 settings = self.client.get_workspace_settings()            
                 self.assertIsNotNone(settings)
                 self.assertIsInstance(settings, AirflowWorkspaceSettings)
@@ -276,21 +327,21 @@ class TestAirflowControlPlaneApiIntegration(unittest.TestCase):
                     f"Expected reversion to starter pool (0000...), but got: {settings.defaultPoolTemplateId}"
                 )
 
-                print(f"Confirmed reversion to starter pool: {settings.defaultPoolTemplateId}")
-                print("Default pool management workflow completed successfully!")
+                logger.info("Confirmed reversion to starter pool: %s", settings.defaultPoolTemplateId)
+                logger.info("Default pool management workflow completed successfully!")
                 
             except Exception as cleanup_error:
                 # If something fails after pool creation, make sure we clean up the pool
                 try:
                     self.client.delete_pool_template(pool_id)
-                    print(f"Cleaned up temporary pool after error: {pool_id}")
+                    logger.info("Cleaned up temporary pool after error: %s", pool_id)
                 except:
                     pass
                 raise cleanup_error
             
         except Exception as e:
             if "404" in str(e):
-                print(f"[WARNING] Control Plane API not available: {e}")
+                logger.warning("Control Plane API not available: %s", e)
                 self.skipTest("Control Plane API endpoints not available in this environment")
             else:
                 raise
@@ -0,0 +1,38 @@
+import pickle
+import unittest
+
+from fabric.airflow.client.api_exceptions import APIError, ClientError, NotFoundError, ServerError
+
+
+class TestApiExceptions(unittest.TestCase):
+    """Unit tests for the APIError hierarchy"""
+
+    def test_from_response_picks_most_specific_class(self):
+        """Test that registered statuses map to their class and others to ClientError/ServerError"""
+        self.assertIsInstance(APIError.from_response(404, "missing"), NotFoundError)
+        self.assertIsInstance(APIError.from_response(409, "conflict"), ClientError)
+        self.assertIsInstance(APIError.from_response(503, "unavailable"), ServerError)
+
+    def test_pickle_round_trip_keeps_every_field(self):
+        """Test that errors survive pickling (e.g. across process pools) with all their fields"""
+        errors = [
+            NotFoundError(message="z", request_id="r1", body={"errorCode": "NotFound"}, headers={"ETag": '"v1"'}),
+            ServerError(status=503, message="unavailable", request_id="r2"),
+            APIError(status=418, message="teapot"),
+        ]
+
+        for error in errors:
+            with self.subTest(error=type(error).__name__):
+                restored = pickle.loads(pickle.dumps(error))
+
+                self.assertIs(type(restored), type(error))
+                self.assertEqual(str(restored), str(error))
+                self.assertEqual(
+                    (restored.status, restored.message, restored.request_id, restored.body, restored.headers),
+                    (error.status, error.message, error.request_id, error.body, error.headers))
+
+        self.assertEqual(str(pickle.loads(pickle.dumps(errors[0]))), "[404] z (Request ID: r1)")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import time
+import unittest
+from unittest import mock
+
+from fabric.airflow.client import authentication_provider
+from fabric.airflow.client.authentication_provider import AuthenticationProvider
+
+
+def fake_token(token="token"):
+    """Build a stand-in for an azure-identity AccessToken"""
+    return mock.Mock(token=token, expires_on=int(time.time()) + 3600)
+
+
+class TestAuthenticationProviderScopes(unittest.TestCase):
+    """Unit tests for providers derived with with_scope, without contacting Azure AD"""
+
+    def setUp(self):
+        """Replace the azure-identity credential classes with mocks"""
+        for name in ("ClientSecretCredential", "InteractiveBrowserCredential"):
+            patcher = mock.patch.object(authentication_provider, name)
+            setattr(self, name, patcher.start())
+            getattr(self, name).return_value.get_token.side_effect = lambda scope: fake_token(f"token for {scope}")
+            self.addCleanup(patcher.stop)
+
+    def test_with_scope_does_not_create_credential(self):
+        """Test that deriving a provider does not start an interactive sign-in"""
+        provider = AuthenticationProvider(tenant_id="tenant", scope="fabric/.default")
+
+        provider.with_scope("airflow/.default")
+
+        self.InteractiveBrowserCredential.assert_not_called()
+
+    def test_first_get_token_creates_shared_credential(self):
+        """Test that whichever provider asks first creates the credential both of them use"""
+        provider = AuthenticationProvider(tenant_id="tenant", scope="fabric/.default")
+        derived = provider.with_scope("airflow/.default")
+
+        self.assertEqual(derived.get_token(), "token for airflow/.default")
+        self.assertEqual(provider.get_token(), "token for fabric/.default")
+
+        self.InteractiveBrowserCredential.assert_called_once_with(tenant_id="tenant")
+        self.assertIs(provider._get_credential(), derived._get_credential())
+
+    def test_explicit_credential_is_shared(self):
+        """Test that a credential passed in is used by derived providers instead of creating one"""
+        credential = mock.Mock()
+        credential.get_token.return_value = fake_token()
+        provider = AuthenticationProvider(tenant_id="tenant", client_id="client", client_secret="secret",
+                                          credential=credential)
+
+        provider.with_scope("airflow/.default").get_token()
+
+        credential.get_token.assert_called_once_with("airflow/.default")
+        self.ClientSecretCredential.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,345 @@
+import json
+import threading
+import time
+import unittest
+from unittest import mock
+
+from fabric.airflow.client import base_api_client
+from fabric.airflow.client.api_exceptions import AuthenticationError, NotFoundError
+from fabric.airflow.client.authentication_provider import AuthenticationProvider
+from fabric.airflow.client.base_api_client import BaseApiClient, ApiResponse
+from fabric.airflow.client.response_cache import ResponseCache
+from tests._mocks import MockedSessionMixin, fake_response
+
+
+class TestApiResponseHeaders(unittest.TestCase):
+    """Unit tests for ApiResponse header access"""
+
+    def test_headers_are_case_insensitive(self):
+        """Test that headers given as a plain dict are looked up case-insensitively"""
+        response = ApiResponse(200, {"etag": '"v1"', "Content-Type": "application/json"}, None)
+
+        self.assertEqual(response.headers["ETag"], '"v1"')
+        self.assertIn("content-type", response.headers)
+        self.assertEqual(response.to_dict()["headers"], {"etag": '"v1"', "Content-Type": "application/json"})
+
+
+class TestDefaultSession(unittest.TestCase):
+    """Unit tests for the sessions of clients created without one"""
+
+    def test_clients_share_connection_pools_per_pool_size(self):
+        """Test that clients get their own session on an adapter shared by clients with the same sizing"""
+        class SmallPoolClient(BaseApiClient):
+            POOL_MAXSIZE = 4
+
+        auth_provider = mock.Mock()
+        first, second = BaseApiClient(auth_provider), BaseApiClient(auth_provider)
+        small = SmallPoolClient(auth_provider)
+
+        def adapter(client):
+            return client._session.get_adapter("https://api.fabric.microsoft.com")
+
+        self.assertIsNot(first._session, second._session)
+        self.assertIs(adapter(first), adapter(second))
+        self.assertIsNot(adapter(small), adapter(first))
+        self.assertIs(adapter(SmallPoolClient(auth_provider)), adapter(small))
+        self.assertEqual(adapter(small)._pool_maxsize, 4)
+
+    def test_clients_do_not_share_cookies(self):
+        """Test that a cookie set for one client is not sent by another client"""
+        auth_provider = mock.Mock()
+        first, second = BaseApiClient(auth_provider), BaseApiClient(auth_provider)
+
+        first._session.cookies.set("session", "first-identity", domain="api.fabric.microsoft.com")
+
+        self.assertEqual(len(second._session.cookies), 0)
+
+
+class TestJsonBodyMocked(MockedSessionMixin, unittest.TestCase):
+    """Unit tests for request body serialization with each JSON backend"""
+
+    def setUp(self):
+        """Set up a client backed by a mocked session"""
+        super().setUp()
+        self.session.request.return_value = fake_response(200)
+        self.client = BaseApiClient(self.auth_provider, session=self.session, is_preview_enabled=False)
+
+    def test_non_string_keys(self):
+        """Test that non-string keys are sent as strings with both the json and orjson backends"""
+        backends = {"json": None, "orjson": base_api_client.orjson}
+
+        for name, backend in backends.items():
+            with self.subTest(backend=name):
+                if name == "orjson" and backend is None:
+                    self.skipTest("orjson is not installed")
+                with mock.patch.object(base_api_client, "orjson", backend):
+                    self.client.post("items", json_body={1: 2, "name": "é"})
+
+                data = self.sent()["data"]
+                self.assertEqual(json.loads(data), {"1": 2, "name": "é"})
+
+
+class TestAuthHeaderMocked(MockedSessionMixin, unittest.TestCase):
+    """Unit tests for the cached Authorization header, without contacting Azure AD"""
+
+    def setUp(self):
+        """Set up a client whose auth provider hands out a new token on every credential call"""
+        super().setUp()
+        self.session.request.return_value = fake_response(200)
+        credential = mock.Mock()
+        credential.get_token.side_effect = [
+            mock.Mock(token=f"token-{i}", expires_on=int(time.time()) + 3600) for i in range(1, 4)]
+        self.auth_provider = AuthenticationProvider(tenant_id="tenant", credential=credential)
+        self.client = BaseApiClient(self.auth_provider, session=self.session, is_preview_enabled=False)
+
+    def sent_authorization(self):
+        """Authorization header of the last request sent through the session"""
+        return self.sent()["headers"]["Authorization"]
+
+    def test_header_is_reused_within_ttl(self):
+        """Test that the token is fetched once for several requests"""
+        self.client.get("items")
+        self.client.get("items")
+
+        self.assertEqual(self.sent_authorization(), "Bearer token-1")
+
+    def test_clear_token_cache_drops_header(self):
+        """Test that clearing the provider's token cache makes the next request use a new token"""
+        self.client.get("items")
+
+        self.auth_provider.clear_token_cache()
+        self.client.get("items")
+
+        self.assertEqual(self.sent_authorization(), "Bearer token-2")
+
+    def test_unauthorized_response_drops_header(self):
+        """Test that after a 401 the header is rebuilt from the auth provider"""
+        self.session.request.return_value = fake_response(401, b'{"message": "expired"}',
+                                                          {"Content-Type": "application/json"})
+        with self.assertRaises(AuthenticationError):
+            self.client.get("items")
+
+        with mock.patch.object(self.auth_provider, "get_token", return_value="renewed") as get_token:
+            self.session.request.return_value = fake_response(200)
+            self.client.get("items")
+
+        get_token.assert_called_once_with()
+        self.assertEqual(self.sent_authorization(), "Bearer renewed")
+
+
+class TestTruncatedDump(unittest.TestCase):
+    """Unit tests for the size cap of logged JSON bodies with each JSON backend"""
+
+    def test_multibyte_payload_at_the_cap(self):
+        """Test that a multibyte payload is reported as truncated exactly when it exceeds the cap"""
+        backends = {"json": None, "orjson": base_api_client.orjson}
+        payload = {"name": "é" * 20}
+
+        for name, backend in backends.items():
+            with self.subTest(backend=name):
+                if name == "orjson" and backend is None:
+                    self.skipTest("orjson is not installed")
+                with mock.patch.object(base_api_client, "orjson", backend):
+                    full, _ = base_api_client._truncated_dump(payload, max_chars=10_000)
+                    size = len(full.encode("utf-8")) if backend is not None else len(full)
+
+                    self.assertEqual(base_api_client._truncated_dump(payload, max_chars=size), (full, False))
+                    text, truncated = base_api_client._truncated_dump(payload, max_chars=size - 1)
+                    self.assertTrue(truncated)
+                    self.assertTrue(full.startswith(text))
+
+
+class TestGetCacheMocked(MockedSessionMixin, unittest.TestCase):
+    """Unit tests for conditional GET caching, without network I/O"""
+
+    def setUp(self):
+        """Set up a client with the GET cache enabled and a mocked session"""
+        super().setUp()
+        self.client = BaseApiClient(
+            self.auth_provider, session=self.session, is_preview_enabled=False, enable_get_cache=True)
+
+    def sent_headers(self, call_index):
+        """Headers of a request sent through the session"""
+        return self.sent(call_index)["headers"]
+
+    def test_not_modified_returns_kept_response(self):
+        """Test that a kept response is revalidated with If-None-Match and returned on 304"""
+        self.session.request.side_effect = [
+            fake_response(200, b'{"value": 1}', {"Content-Type": "application/json", "ETag": '"v1"'}),
+            fake_response(304),
+        ]
+
+        first = self.client.get("items")
+        second = self.client.get("items")
+
+        self.assertEqual(second, first)
+        self.assertEqual(second.body, {"value": 1})
+        self.assertNotIn("If-None-Match", self.sent_headers(0))
+        self.assertEqual(self.sent_headers(1)["If-None-Match"], '"v1"')
+
+    def test_lowercase_validators_are_kept(self):
+        """Test that lower-case etag and last-modified headers are used for revalidation"""
+        self.session.request.side_effect = [
+            fake_response(200, b"{}", {"Content-Type": "application/json", "etag": '"v1"',
+                                       "last-modified": "Wed, 14 Oct 2026 10:00:00 GMT"}),
+            fake_response(304),
+        ]
+
+        self.client.get("items")
+        self.client.get("items")
+
+        self.assertEqual(self.sent_headers(1)["If-None-Match"], '"v1"')
+        self.assertEqual(self.sent_headers(1)["If-Modified-Since"], "Wed, 14 Oct 2026 10:00:00 GMT")
+
+    def test_response_without_validators_is_not_kept(self):
+        """Test that a response without ETag or Last-Modified is fetched again unconditionally"""
+        self.session.request.side_effect = [
+            fake_response(200, b"{}", {"Content-Type": "application/json"}),
+            fake_response(200, b"{}", {"Content-Type": "application/json"}),
+        ]
+
+        self.client.get("items")
+        self.client.get("items")
+
+        self.assertNotIn("If-None-Match", self.sent_headers(1))
+
+    def test_caller_conditional_request_bypasses_cache(self):
+        """Test that a caller-supplied conditional header, in any case, is sent unchanged"""
+        self.session.request.side_effect = [
+            fake_response(200, b"{}", {"Content-Type": "application/json", "ETag": '"v1"'}),
+            fake_response(304),
+        ]
+
+        self.client.get("items")
+        response = self.client.get("items", headers={"if-none-match": '"v0"'})
+
+        self.assertEqual(response.status, 304)
+        self.assertNotIn("If-None-Match", self.sent_headers(1))
+
+    def test_mutating_a_response_does_not_change_the_cache(self):
+        """Test that changes to a returned body are not seen by the next cached read"""
+        self.session.request.side_effect = [
+            fake_response(200, b'{"value": [1]}', {"Content-Type": "application/json", "ETag": '"v1"'}),
+            fake_response(304),
+            fake_response(304),
+        ]
+
+        self.client.get("items").body["value"].append(2)
+        self.client.get("items").body["value"].append(3)
+
+        self.assertEqual(self.client.get("items").body, {"value": [1]})
+
+    def test_shared_cache_is_keyed_by_base_url_and_auth_provider(self):
+        """Test that clients sharing a cache don't revalidate each other's responses"""
+        cache = ResponseCache()
+        other_provider = mock.Mock()
+        other_provider.get_token.return_value = "other token"
+        clients = [
+            BaseApiClient(self.auth_provider, session=self.session, enable_get_cache=True, cache=cache),
+            BaseApiClient(other_provider, session=self.session, enable_get_cache=True, cache=cache),
+            BaseApiClient(self.auth_provider, base_url="https://other.example.com", session=self.session,
+                          enable_get_cache=True, cache=cache),
+        ]
+        self.session.request.return_value = fake_response(200, b"{}", {"ETag": '"v1"'})
+
+        for client in clients:
+            client.get("items")
+
+        self.assertEqual(len(cache), 3)
+        self.assertTrue(all("If-None-Match" not in self.sent_headers(i) for i in range(3)))
+
+    def test_shared_cache_is_not_cleared_on_close(self):
+        """Test that close() leaves a cache passed in by the caller intact"""
+        cache = ResponseCache()
+        client = BaseApiClient(self.auth_provider, session=self.session, enable_get_cache=True, cache=cache)
+        self.session.request.return_value = fake_response(200, b"{}", {"ETag": '"v1"'})
+
+        client.get("items")
+        client.close()
+
+        self.assertEqual(len(cache), 1)
+
+
+class TestPaginateMocked(MockedSessionMixin, unittest.TestCase):
+    """Unit tests for paginate(), without network I/O"""
+
+    def setUp(self):
+        """Set up a client backed by a mocked session"""
+        super().setUp()
+        self.client = BaseApiClient(self.auth_provider, session=self.session, is_preview_enabled=False)
+
+    def test_next_page_is_prefetched(self):
+        """Test that the second page is requested before the first page has been consumed"""
+        second_page_requested = threading.Event()
+
+        def request(method, url, **kwargs):
+            if "continuationToken=t2" in url:
+                second_page_requested.set()
+                return fake_response(200, b'{"value": [3]}', {"Content-Type": "application/json"})
+            return fake_response(200, b'{"value": [1, 2], "continuationToken": "t2"}', {"Content-Type": "application/json"})
+        self.session.request.side_effect = request
+
+        pages = self.client.paginate("items", params={"type": "ApacheAirflowJob"})
+        self.assertEqual(next(pages), 1)
+        self.assertTrue(second_page_requested.wait(timeout=5))
+
+        self.assertEqual(list(pages), [2, 3])
+        urls = [c.kwargs["url"] for c in self.session.request.call_args_list]
+        self.assertTrue(all("type=ApacheAirflowJob" in url for url in urls))
+
+    def test_non_object_page_raises_value_error(self):
+        """Test that a page whose body is not a JSON object raises a clear error"""
+        self.session.request.return_value = fake_response(200, b'[1, 2]', {"Content-Type": "application/json"})
+
+        with self.assertRaisesRegex(ValueError, "expected a JSON object page, got list"):
+            list(self.client.paginate("items"))
+
+
+class TestAbatchMocked(MockedSessionMixin, unittest.IsolatedAsyncioTestCase):
+    """Unit tests for abatch(), without network I/O"""
+
+    def setUp(self):
+        """Set up a client backed by a mocked session"""
+        super().setUp()
+        self.client = BaseApiClient(self.auth_provider, session=self.session, is_preview_enabled=False)
+
+    def respond(self, method, url, **kwargs):
+        """Answer with the requested path as the body, or 404 for paths containing 'missing'"""
+        path = url.rsplit("/", 1)[-1]
+        if "missing" in path:
+            return fake_response(404, b'{"message": "not found"}', {"Content-Type": "application/json"})
+        return fake_response(200, json.dumps({"path": path}).encode(), {"Content-Type": "application/json"})
+
+    async def test_requests_run_concurrently_and_keep_order(self):
+        """Test that all calls are in flight together and results follow the order of calls"""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def request(method, url, **kwargs):
+            barrier.wait()
+            return self.respond(method, url, **kwargs)
+        self.session.request.side_effect = request
+
+        responses = await self.client.abatch([
+            ("GET", "a", {}),
+            ("POST", "b", {"json_body": {"x": 1}}),
+            ("GET", "c", {"params": {"type": "ApacheAirflowJob"}}),
+        ])
+
+        self.assertEqual([r.body["path"] for r in responses], ["a", "b", "c?type=ApacheAirflowJob"])
+        self.assertEqual(sorted(c.kwargs["method"] for c in self.session.request.call_args_list), ["GET", "GET", "POST"])
+
+    async def test_return_exceptions(self):
+        """Test that failures are raised by default and returned in place with return_exceptions"""
+        self.session.request.side_effect = self.respond
+        calls = [("GET", "a", {}), ("GET", "missing", {})]
+
+        with self.assertRaises(NotFoundError):
+            await self.client.abatch(calls)
+        responses = await self.client.abatch(calls, return_exceptions=True)
+
+        self.assertEqual(responses[0].body, {"path": "a"})
+        self.assertIsInstance(responses[1], NotFoundError)
+
+
+if __name__ == '__main__':
+    unittest.main()
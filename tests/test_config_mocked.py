@@ -0,0 +1,72 @@
+import time
+import unittest
+from unittest import mock
+
+from fabric.airflow.client import authentication_provider
+from fabric.airflow.client.base_api_client import BaseApiClient
+from fabric.airflow.client.config import Config
+
+
+class TestConfigMocked(unittest.TestCase):
+    """Unit tests for the auth providers and clients shared by a Config, without network I/O"""
+
+    def setUp(self):
+        """Set up a config and replace the SPN credential class with a mock"""
+        patcher = mock.patch.object(authentication_provider, "ClientSecretCredential")
+        self.credential_class = patcher.start()
+        self.credential_class.return_value.get_token.side_effect = lambda scope: mock.Mock(
+            token=f"token for {scope}", expires_on=int(time.time()) + 3600)
+        self.addCleanup(patcher.stop)
+        self.config = Config(
+            tenant_id="tenant", client_id="client", client_secret="secret",
+            workspace_id="ws-1", airflow_job_id="job-1",
+            airflow_webserver_url="https://airflow.example.com",
+            fabric_api_scope="fabric/.default", airflow_api_scope="airflow/.default")
+
+    def test_providers_are_cached_per_scope(self):
+        """Test that clients of the same API share one provider and each scope has its own"""
+        fabric = self.config._shared_fabric_auth_provider()
+        airflow = self.config._shared_airflow_auth_provider()
+
+        self.assertIs(self.config._shared_fabric_auth_provider(), fabric)
+        self.assertIsNot(airflow, fabric)
+        self.assertEqual(self.config._auth_providers, {"fabric/.default": fabric, "airflow/.default": airflow})
+        self.assertIs(self.config.crud_client().auth_provider, fabric)
+        self.assertIs(self.config.files_client().auth_provider, fabric)
+        self.assertIs(self.config.airflow_native_client().auth_provider, airflow)
+
+    def test_providers_share_one_lazily_created_credential(self):
+        """Test that the credential is created by the first get_token and then shared across scopes"""
+        fabric = self.config._shared_fabric_auth_provider()
+        airflow = self.config._shared_airflow_auth_provider()
+        self.credential_class.assert_not_called()
+
+        self.assertEqual(airflow.get_token(), "token for airflow/.default")
+        self.assertEqual(fabric.get_token(), "token for fabric/.default")
+
+        self.credential_class.assert_called_once()
+
+    def test_warmup_opens_connection_to_each_base_url(self):
+        """Test that warmup sends a HEAD request to the Fabric API and the Airflow webserver"""
+        session = mock.Mock()
+        with mock.patch.object(BaseApiClient, "_create_session", return_value=session):
+            self.config.warmup(timeout=3)
+
+        urls = sorted(c.args[0] for c in session.head.call_args_list)
+        self.assertEqual(urls, ["https://airflow.example.com", "https://api.fabric.microsoft.com"])
+        self.assertTrue(all(c.kwargs["timeout"] == 3 for c in session.head.call_args_list))
+
+    def test_warmup_ignores_connection_failures(self):
+        """Test that a failed warmup request is not raised"""
+        import requests
+
+        session = mock.Mock()
+        session.head.side_effect = requests.ConnectionError("unreachable")
+        with mock.patch.object(BaseApiClient, "_create_session", return_value=session):
+            self.config.warmup()
+
+        self.assertEqual(session.head.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
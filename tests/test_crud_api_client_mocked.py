@@ -0,0 +1,241 @@
+import unittest
+from unittest import mock
+
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from fabric.airflow.client import fabric_crud_api_client, response_cache
+from fabric.airflow.client.api_exceptions import ClientError, NotFoundError, ServerError, ValidationError
+from fabric.airflow.client.fabric_crud_api_client import AirflowCrudApiClient
+from fabric.airflow.client.fabric_crud_model import AirflowItem
+from fabric.airflow.client.response_cache import ResponseCache
+from tests._mocks import MockedSessionMixin, json_response
+
+WORKSPACE_ID = "ws-1"
+AIRFLOW_JOB_ID = "job-1"
+CREATED_JOB = {"id": AIRFLOW_JOB_ID, "type": "ApacheAirflowJob", "displayName": "job", "workspaceId": WORKSPACE_ID}
+
+
+class TestCrudRetryMocked(MockedSessionMixin, unittest.TestCase):
+    """Unit tests for retrying write operations, without network I/O or real sleeps"""
+
+    def setUp(self):
+        """Set up a CRUD client backed by a mocked session and a mocked time.sleep"""
+        super().setUp()
+        self.crud_client = AirflowCrudApiClient(self.auth_provider, session=self.session, is_preview_enabled=False)
+        patcher = mock.patch.object(fabric_crud_api_client.time, "sleep")
+        self.sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_create_retries_throttling_with_capped_retry_after(self):
+        """Test that a 429 create is retried after Retry-After, capped at four times RETRY_MAX_DELAY"""
+        self.session.request.side_effect = [
+            json_response(429, {"message": "throttled"}, {"Retry-After": "3"}),
+            json_response(429, {"message": "throttled"}, {"Retry-After": "3600"}),
+            json_response(201, CREATED_JOB),
+        ]
+
+        item = self.crud_client.create_airflow_job(WORKSPACE_ID, AirflowItem(displayName="job"))
+
+        self.assertEqual(item.id, AIRFLOW_JOB_ID)
+        self.assertEqual(self.session.request.call_count, 3)
+        self.assertEqual([c.args[0] for c in self.sleep.call_args_list],
+                         [3.0, AirflowCrudApiClient.RETRY_MAX_DELAY * 4])
+
+    def test_create_retries_connections_that_were_not_opened(self):
+        """Test that a create is sent again when the connection could not be opened"""
+        refused = MaxRetryError(None, "https://api.fabric.microsoft.com", NewConnectionError(None, "refused"))
+        self.session.request.side_effect = [
+            requests.ConnectionError(refused),
+            requests.ConnectTimeout("timed out"),
+            json_response(201, CREATED_JOB),
+        ]
+
+        item = self.crud_client.create_airflow_job(WORKSPACE_ID, AirflowItem(displayName="job"))
+
+        self.assertEqual(item.id, AIRFLOW_JOB_ID)
+        self.assertEqual(self.session.request.call_count, 3)
+
+    def test_create_does_not_retry_connection_errors_after_send(self):
+        """Test that a create is not sent again when the connection failed after the request was sent"""
+        self.session.request.side_effect = [requests.ConnectionError("reset"), json_response(201, CREATED_JOB)]
+
+        with self.assertRaises(requests.ConnectionError):
+            self.crud_client.create_airflow_job(WORKSPACE_ID, AirflowItem(displayName="job"))
+
+        self.assertEqual(self.session.request.call_count, 1)
+
+    def test_delete_retries_connection_errors_after_send(self):
+        """Test that an idempotent delete is sent again after any connection error"""
+        self.session.request.side_effect = [requests.ConnectionError("reset"), json_response(200, {})]
+
+        self.crud_client.delete_airflow_job(WORKSPACE_ID, AIRFLOW_JOB_ID)
+
+        self.assertEqual(self.session.request.call_count, 2)
+
+    def test_create_does_not_retry_server_errors(self):
+        """Test that a 5xx create is raised at once since the job may have been created"""
+        self.session.request.return_value = json_response(503, {"message": "unavailable"})
+
+        with self.assertRaises(ServerError):
+            self.crud_client.create_airflow_job(WORKSPACE_ID, AirflowItem(displayName="job"))
+
+        self.assertEqual(self.session.request.call_count, 1)
+
+    def test_update_retries_server_errors_up_to_max_attempts(self):
+        """Test that an idempotent update is attempted RETRY_MAX_ATTEMPTS times with bounded backoff"""
+        self.session.request.return_value = json_response(503, {"message": "unavailable"})
+        definition = mock.Mock()
+        definition.to_dict.return_value = {"displayName": "job", "definition": {"parts": []}}
+
+        with self.assertRaises(ServerError):
+            self.crud_client.update_airflow_job_definition(WORKSPACE_ID, AIRFLOW_JOB_ID, definition)
+
+        self.assertEqual(self.session.request.call_count, AirflowCrudApiClient.RETRY_MAX_ATTEMPTS)
+        self.assertEqual(self.sleep.call_count, AirflowCrudApiClient.RETRY_MAX_ATTEMPTS - 1)
+        for attempt, c in enumerate(self.sleep.call_args_list, start=1):
+            self.assertLessEqual(c.args[0], min(AirflowCrudApiClient.RETRY_MAX_DELAY,
+                                                AirflowCrudApiClient.RETRY_BASE_DELAY * 2 ** (attempt - 1)))
+
+    def test_client_errors_are_not_retried(self):
+        """Test that 4xx responses other than 429 give up on the first attempt"""
+        for status, error in ((400, ValidationError), (409, ClientError)):
+            with self.subTest(status=status):
+                self.session.request.reset_mock()
+                self.session.request.return_value = json_response(status, {"message": "rejected"})
+
+                with self.assertRaises(error):
+                    self.crud_client.delete_airflow_job(WORKSPACE_ID, AIRFLOW_JOB_ID)
+
+                self.assertEqual(self.session.request.call_count, 1)
+        self.sleep.assert_not_called()
+
+    def test_delete_not_found_after_retry_is_success(self):
+        """Test that a retried delete that finds the job gone returns instead of raising"""
+        self.session.request.side_effect = [
+            json_response(503, {"message": "unavailable"}),
+            json_response(404, {"message": "not found"}),
+        ]
+
+        response = self.crud_client.delete_airflow_job(WORKSPACE_ID, AIRFLOW_JOB_ID)
+
+        self.assertEqual(response.status, 404)
+        self.assertEqual(self.session.request.call_count, 2)
+
+    def test_delete_not_found_on_first_attempt_raises(self):
+        """Test that deleting a job that never existed still raises NotFoundError"""
+        self.session.request.return_value = json_response(404, {"message": "not found"})
+
+        with self.assertRaises(NotFoundError):
+            self.crud_client.delete_airflow_job(WORKSPACE_ID, AIRFLOW_JOB_ID)
+
+
+class TestCrudPaginationMocked(MockedSessionMixin, unittest.TestCase):
+    """Unit tests for the CRUD list iterators, without network I/O"""
+
+    def setUp(self):
+        """Set up a CRUD client backed by a mocked session"""
+        super().setUp()
+        self.crud_client = AirflowCrudApiClient(self.auth_provider, session=self.session, is_preview_enabled=False)
+
+    def test_iter_workspace_items_follows_continuation_tokens(self):
+        """Test that every page is requested with the filter and the previous page's token"""
+        self.session.request.side_effect = [
+            json_response(200, {"value": [{"id": "a"}], "continuationToken": "t2"}),
+            json_response(200, {"value": [{"id": "b"}]}),
+        ]
+
+        items = list(self.crud_client.iter_workspace_items(WORKSPACE_ID, type_filter="ApacheAirflowJob"))
+
+        self.assertEqual([item["id"] for item in items], ["a", "b"])
+        urls = [self.sent(i)["url"] for i in range(self.session.request.call_count)]
+        self.assertEqual(urls, [
+            f"https://api.fabric.microsoft.com/v1/workspaces/{WORKSPACE_ID}/items?type=ApacheAirflowJob",
+            f"https://api.fabric.microsoft.com/v1/workspaces/{WORKSPACE_ID}/items?type=ApacheAirflowJob&continuationToken=t2",
+        ])
+
+
+class TestCrudCacheMocked(MockedSessionMixin, unittest.TestCase):
+    """Unit tests for read caching in the CRUD client, with a controlled clock"""
+
+    def setUp(self):
+        """Set up a CRUD client with a ResponseCache, a mocked session and a fake monotonic clock"""
+        super().setUp()
+        self.now = 1000.0
+        patcher = mock.patch.object(response_cache.time, "monotonic", side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.cache = ResponseCache(ttl_jitter=0)
+        self.crud_client = AirflowCrudApiClient(
+            self.auth_provider, session=self.session, is_preview_enabled=False, cache=self.cache,
+            cache_policies={"list_airflow_jobs": 60, "list_workspace_items": 0})
+
+    def sent_headers(self):
+        """Headers of the last request sent through the session"""
+        return self.sent()["headers"]
+
+    def test_fresh_entry_is_served_without_request(self):
+        """Test that a read within its TTL is answered from the cache"""
+        self.session.request.return_value = json_response(200, {"value": [CREATED_JOB]})
+
+        first = self.crud_client.list_airflow_jobs(WORKSPACE_ID)
+        second = self.crud_client.list_airflow_jobs(WORKSPACE_ID)
+
+        self.assertEqual(second, first)
+        self.assertEqual(self.session.request.call_count, 1)
+
+    def test_expired_entry_is_revalidated_and_renewed(self):
+        """Test that an expired entry is revalidated with If-None-Match and a 304 renews it"""
+        self.session.request.side_effect = [
+            json_response(200, {"value": [CREATED_JOB]}, {"ETag": '"v1"'}),
+            json_response(304),
+        ]
+        first = self.crud_client.list_airflow_jobs(WORKSPACE_ID)
+
+        self.now += 61
+        second = self.crud_client.list_airflow_jobs(WORKSPACE_ID)
+        self.assertEqual(self.sent_headers()["If-None-Match"], '"v1"')
+        self.assertEqual(second, first)
+
+        self.now += 59
+        self.assertEqual(self.crud_client.list_airflow_jobs(WORKSPACE_ID), first)
+        self.assertEqual(self.session.request.call_count, 2)
+
+    def test_mutating_yielded_jobs_does_not_change_the_cache(self):
+        """Test that changes to the dicts yielded by iter_airflow_jobs are not seen by the next read"""
+        self.session.request.return_value = json_response(200, {"value": [dict(CREATED_JOB)]})
+
+        for job in self.crud_client.iter_airflow_jobs(WORKSPACE_ID):
+            job["displayName"] = "changed"
+
+        self.assertEqual(self.crud_client.list_airflow_jobs(WORKSPACE_ID).body, {"value": [CREATED_JOB]})
+        self.assertEqual(self.session.request.call_count, 1)
+
+    def test_write_invalidates_cached_reads_of_its_workspace(self):
+        """Test that a delete drops the workspace's cached reads and keeps other workspaces' reads"""
+        self.session.request.side_effect = lambda method, url, **kwargs: json_response(
+            200, {"value": []}, {"ETag": '"v1"'})
+        self.crud_client.list_airflow_jobs(WORKSPACE_ID)
+        self.crud_client.list_airflow_jobs("ws-2")
+
+        self.crud_client.delete_airflow_job(WORKSPACE_ID, AIRFLOW_JOB_ID)
+        self.session.request.reset_mock()
+        self.crud_client.list_airflow_jobs(WORKSPACE_ID)
+        self.crud_client.list_airflow_jobs("ws-2")
+
+        self.assertEqual(self.session.request.call_count, 1)
+        self.assertNotIn("If-None-Match", self.sent_headers())
+
+    def test_zero_ttl_policy_disables_caching(self):
+        """Test that an operation with a TTL of 0 always sends a request"""
+        self.session.request.return_value = json_response(200, {"value": []})
+
+        self.crud_client.list_workspace_items(WORKSPACE_ID)
+        self.crud_client.list_workspace_items(WORKSPACE_ID)
+
+        self.assertEqual(self.session.request.call_count, 2)
+        self.assertEqual(len(self.cache), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest import mock
+
+from fabric.airflow.client.base_api_client import ApiResponse
+from fabric.airflow.client.fabric_crud_async_api_client import AsyncAirflowCrudApiClient
+
+WORKSPACE_ID = "ws-1"
+
+
+def page(values, continuation_token=None):
+    """Build a list response page"""
+    body = {"value": values}
+    if continuation_token:
+        body["continuationToken"] = continuation_token
+    return ApiResponse(status=200, headers={}, body=body)
+
+
+class TestAsyncCrudClientMocked(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for the asyncio CRUD client, with the synchronous client's methods mocked"""
+
+    def setUp(self):
+        """Set up an async client whose underlying synchronous client never sends requests"""
+        self.client = AsyncAirflowCrudApiClient(mock.Mock(), max_concurrency=2, session=mock.Mock())
+        self.sync_client = self.client.sync_client
+
+    async def test_concurrency_is_bounded(self):
+        """Test that no more than max_concurrency calls run at once"""
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def get_workspace_info(workspace_id):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+            return workspace_id
+        self.sync_client.get_workspace_info = get_workspace_info
+
+        results = await asyncio.gather(*(self.client.get_workspace_info(f"ws-{i}") for i in range(6)))
+
+        self.assertEqual(results, [f"ws-{i}" for i in range(6)])
+        self.assertEqual(peak, 2)
+
+    async def test_client_can_be_reused_in_another_event_loop(self):
+        """Test that a client used in one event loop still bounds concurrency in the next one"""
+        self.sync_client.get_workspace_info = lambda workspace_id: time.sleep(0.01) or workspace_id
+
+        async def get_workspace_infos():
+            return await asyncio.gather(*(self.client.get_workspace_info(f"ws-{i}") for i in range(4)))
+
+        def run_in_new_loop():
+            return asyncio.run(asyncio.wait_for(get_workspace_infos(), timeout=5))
+
+        first = await asyncio.to_thread(run_in_new_loop)
+        second = await asyncio.to_thread(run_in_new_loop)
+
+        self.assertEqual(first, second)
+        self.assertEqual(second, [f"ws-{i}" for i in range(4)])
+
+    async def test_iter_airflow_jobs_prefetches_next_page(self):
+        """Test that the next page is requested before the current page has been consumed"""
+        requested = []
+        pages = {None: page([1, 2], "t2"), "t2": page([3], "t3"), "t3": page([4])}
+
+        def list_airflow_jobs(workspace_id, continuation_token=None):
+            requested.append(continuation_token)
+            return pages[continuation_token]
+        self.sync_client.list_airflow_jobs = list_airflow_jobs
+
+        jobs = self.client.iter_airflow_jobs(WORKSPACE_ID)
+        self.assertEqual(await jobs.__anext__(), 1)
+        await asyncio.sleep(0.05)
+        self.assertEqual(requested, [None, "t2"])
+
+        self.assertEqual([job async for job in jobs], [2, 3, 4])
+        self.assertEqual(requested, [None, "t2", "t3"])
+
+    async def test_iter_workspace_items_validates_page_bodies(self):
+        """Test that an empty page ends the iteration and a non-object page raises a clear error"""
+        bodies = {None: {"value": [1], "continuationToken": "t2"}, "t2": None}
+
+        def list_workspace_items(workspace_id, type_filter=None, continuation_token=None):
+            return ApiResponse(status=200, headers={}, body=bodies[continuation_token])
+        self.sync_client.list_workspace_items = list_workspace_items
+
+        self.assertEqual([item async for item in self.client.iter_workspace_items(WORKSPACE_ID)], [1])
+
+        bodies["t2"] = [2]
+        with self.assertRaisesRegex(ValueError, "expected a JSON object page, got list"):
+            [item async for item in self.client.iter_workspace_items(WORKSPACE_ID)]
+
+    async def test_iter_pages_cancels_prefetch_when_closed_early(self):
+        """Test that stopping the iteration cancels the page being prefetched"""
+        prefetch_started = asyncio.Event()
+        prefetch = asyncio.get_running_loop().create_future()
+
+        async def fetch_page(token):
+            if token is None:
+                return page([1], "t2")
+            prefetch_started.set()
+            return await prefetch
+
+        pages = self.client._iter_pages(fetch_page)
+        self.assertEqual(await pages.__anext__(), 1)
+        await prefetch_started.wait()
+        await pages.aclose()
+        await asyncio.sleep(0)
+
+        self.assertTrue(prefetch.cancelled())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+import base64
+import json
+import pathlib
+import tempfile
+import unittest
+from unittest import mock
+
+from fabric.airflow.client import fabric_crud_model
+from fabric.airflow.client.fabric_crud_model import FabricItemDefinition
+
+
+def decoded_payloads(definition):
+    """Map each part path of definition.to_dict() to its base64-decoded payload bytes"""
+    return {part["path"]: base64.b64decode(part["payload"]) for part in definition.to_dict()["definition"]["parts"]}
+
+
+class TestFabricItemDefinitionFiles(unittest.TestCase):
+    """Unit tests for adding DAG files from disk to a FabricItemDefinition"""
+
+    def setUp(self):
+        """Set up a temporary directory holding an Airflow definition file"""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = pathlib.Path(temp_dir.name)
+        definition_file = self.write("apacheairflowjob-content.json", json.dumps({"requirements": []}))
+        self.definition = FabricItemDefinition(displayName="job", airflow_definition_file=definition_file)
+
+    def write(self, relative_path, content):
+        """Write content (str or bytes) under the temporary directory and return its path"""
+        path = self.root / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(content, bytes):
+            path.write_bytes(content)
+        else:
+            path.write_text(content, encoding="utf-8")
+        return str(path)
+
+    def test_add_dag_files_round_trips_file_bytes(self):
+        """Test that every file is added at its destination path and sent with its exact bytes"""
+        files = {
+            "dags/ascii_dag.py": b"from airflow import DAG\n",
+            "dags/unicode_dag.py": "# café – 日本\r\n".encode("utf-8"),
+        }
+        dag_files = {dag_path: self.write(f"src/{dag_path}", content) for dag_path, content in files.items()}
+
+        self.definition.add_dag_files(dag_files, max_workers=2)
+
+        payloads = decoded_payloads(self.definition)
+        for dag_path, content in files.items():
+            self.assertEqual(payloads[dag_path], content)
+        self.assertEqual(self.definition.get_part("dags/unicode_dag.py").payload, files["dags/unicode_dag.py"].decode("utf-8"))
+
+    def test_add_dag_files_overrides_existing_parts(self):
+        """Test that a file added again replaces the earlier part instead of duplicating it"""
+        self.definition.add_dag("dags/my_dag.py", "old = True\n")
+
+        with self.assertLogs("fabric.airflow.client.fabric_crud_model", "WARNING"):
+            self.definition.add_dag_files({"dags/my_dag.py": self.write("my_dag.py", "new = True\n")})
+
+        paths = [part.path for part in self.definition.parts]
+        self.assertEqual(paths.count("dags/my_dag.py"), 1)
+        self.assertEqual(decoded_payloads(self.definition)["dags/my_dag.py"], b"new = True\n")
+
+    def test_add_dag_directory_adds_matching_files_in_sorted_order(self):
+        """Test that files are added at paths relative to the directory, sorted, and filtered by pattern"""
+        for relative_path in ("local/zeta.py", "local/alpha.py", "local/sub/beta.py", "local/notes.txt"):
+            self.write(relative_path, f"# {relative_path}\n")
+
+        self.definition.add_dag_directory("dags/", str(self.root / "local"))
+
+        dag_paths = [part.path for part in self.definition.parts if part.path.startswith("dags/")]
+        self.assertEqual(dag_paths, ["dags/alpha.py", "dags/sub/beta.py", "dags/zeta.py"])
+        self.assertEqual(decoded_payloads(self.definition)["dags/sub/beta.py"], b"# local/sub/beta.py\n")
+
+    def test_add_dag_directory_with_pattern(self):
+        """Test that only files matching the pattern are added"""
+        self.write("plugins/lib.py", "")
+        self.write("plugins/README.md", "# plugins\n")
+
+        self.definition.add_dag_directory("plugins", str(self.root / "plugins"), pattern="*.md")
+
+        self.assertEqual([part.path for part in self.definition.parts][2:], ["plugins/README.md"])
+
+
+class TestDefinitionPartEncoding(unittest.TestCase):
+    """Unit tests for the base64 encoding cache of definition parts"""
+
+    def setUp(self):
+        """Count the base64 encodings done by the model module"""
+        patcher = mock.patch.object(fabric_crud_model, "_b64encode", wraps=fabric_crud_model._b64encode)
+        self.b64encode = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.definition = FabricItemDefinition.from_api_response("job", [])
+
+    def test_unchanged_payload_is_encoded_once(self):
+        """Test that repeated to_dict() calls reuse the encoding of an unchanged string payload"""
+        self.definition.add_dag("dags/my_dag.py", "x = 1\n")
+
+        first = self.definition.to_dict()
+        second = self.definition.to_dict()
+
+        self.assertEqual(second, first)
+        self.assertEqual(self.b64encode.call_count, 1)
+
+    def test_reassigned_payload_is_encoded_again(self):
+        """Test that assigning a new payload invalidates the cached encoding"""
+        self.definition.add_dag("dags/my_dag.py", "x = 1\n")
+        self.definition.to_dict()
+
+        self.definition.get_part("dags/my_dag.py").payload = "x = 2\n"
+
+        self.assertEqual(decoded_payloads(self.definition)["dags/my_dag.py"], b"x = 2\n")
+        self.assertEqual(self.b64encode.call_count, 2)
+
+    def test_file_part_is_encoded_when_read(self):
+        """Test that a part read from disk is sent with the encoding of its raw bytes, without encoding again"""
+        with tempfile.NamedTemporaryFile("wb", suffix=".py", delete=False) as f:
+            f.write("é = 1\n".encode("utf-8"))
+        self.addCleanup(pathlib.Path(f.name).unlink)
+        self.definition.add_dag_file("dags/my_dag.py", f.name)
+        self.b64encode.reset_mock()
+
+        self.assertEqual(decoded_payloads(self.definition)["dags/my_dag.py"], "é = 1\n".encode("utf-8"))
+        self.b64encode.assert_not_called()
+
+    def test_api_response_part_is_sent_back_unchanged(self):
+        """Test that an unmodified part from the API keeps its payload exactly as received"""
+        encoded = base64.b64encode(b"x = 1\n").decode("ascii")
+        definition = FabricItemDefinition.from_api_response("job", [{"path": "dags/my_dag.py", "payload": encoded}])
+
+        self.assertEqual(definition.to_dict()["definition"]["parts"][0]["payload"], encoded)
+        self.b64encode.assert_not_called()
+
+    def test_dict_payload_changes_are_sent(self):
+        """Test that in-place changes to a payload returned by as_json() are encoded on every to_dict()"""
+        encoded = base64.b64encode(b'{"requirements": []}').decode("ascii")
+        definition = FabricItemDefinition.from_api_response(
+            "job", [{"path": "apacheairflowjob-content.json", "payload": encoded}])
+        definition.to_dict()
+
+        definition.get_airflow_definition().as_json()["requirements"].append("flask-bcrypt")
+
+        payload = decoded_payloads(definition)["apacheairflowjob-content.json"]
+        self.assertEqual(json.loads(payload), {"requirements": ["flask-bcrypt"]})
+
+
+if __name__ == '__main__':
+    unittest.main()
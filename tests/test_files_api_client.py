@@ -1,28 +1,51 @@
 import os
 import unittest
 import time
+import itertools
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
 
 from fabric.airflow.client.fabric_files_api_client import AirflowFilesApiClient
 from fabric.airflow.client.api_exceptions import APIError
-from fabric.airflow.client.config import Config
+from tests._perf import budget
+from tests._config import get_config
+
+# Every test in this module talks to a live workspace; run them with: pytest -m integration
+pytestmark = pytest.mark.integration
+
+# Worker id set by pytest-xdist (gw0, gw1, ...) so parallel workers never share file names
+worker_id = os.getenv('PYTEST_XDIST_WORKER', 'main')
 
-# Initialize Config from environment variable CONFIG_FILE_PATH
-# Set environment variable: $env:CONFIG_FILE_PATH = "c:\src\ApiTest\config.ini"
-config_file = os.getenv('CONFIG_FILE_PATH')
-assert config_file is not None, "CONFIG_FILE_PATH environment variable must be set"
-config = Config.from_file(config_file, 'TEST')
+# Run id (start time + pid) plus a per-test counter: unique across runs, workers and tests in the same second
+run_id = f"{int(time.time())}_{os.getpid()}"
+test_counter = itertools.count()
 
 class TestFilesApiClientIntegration(unittest.TestCase):
     """Integration test cases for Files API client operations exposed by ConfigClient"""
 
+    # Per-test latency budget (seconds) for tests that call the Files API
+    TEST_BUDGET = 5.0
+
+    # Immutable file contents shared by every test
+    test_text_content = "# Test DAG file\nfrom airflow import DAG\nprint('Hello World')"
+    test_binary_content = b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01'
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the files client once so every test reuses its keep-alive connections"""
+        cls.files_client = get_config().files_client()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Release the files client"""
+        cls.files_client.close()
+
     def setUp(self):
         """Set up test fixtures"""
-        self.files_client = config.files_client()
-        self.test_text_content = "# Test DAG file\nfrom airflow import DAG\nprint('Hello World')"
-        self.test_binary_content = b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01'
-        
-        # Use timestamp to ensure unique file names for each test run
-        self.timestamp = str(int(time.time()))
+        # Use run id and test counter to ensure unique file names for each test
+        self.timestamp = f"{run_id}_{next(test_counter)}_{worker_id}"
         self.test_dag_path = f"dags/test_dag_{self.timestamp}.py"
         self.test_plugin_path = f"plugins/test_plugin_{self.timestamp}.py"
         self.test_binary_path = f"plugins/test_binary_{self.timestamp}.dll"
@@ -35,17 +58,18 @@ class TestFilesApiClientIntegration(unittest.TestCase):
             self.test_binary_path
         ]
         
-        for file_path in test_files:
-            try:
-                self.files_client.delete_file(file_path)
-            except (APIError):
-                # Ignore errors during cleanup
-                pass
+        try:
+            # Deletes run concurrently; every file is attempted even if some of them fail
+            self.files_client.delete_files(test_files)
+        except (APIError):
+            # Ignore errors during cleanup
+            pass
 
     def test_files_client_type(self):
         """Test that ConfigClient returns correct files client type"""
         self.assertIsInstance(self.files_client, AirflowFilesApiClient)
 
+    @budget(TEST_BUDGET)
     def test_create_dag_file(self):
         """Test creating a DAG file (text content)"""
         response = self.files_client.create_or_update_file(self.test_dag_path, self.test_text_content)
@@ -55,6 +79,7 @@ class TestFilesApiClientIntegration(unittest.TestCase):
         if hasattr(response, 'headers') and response.headers:
             self.assertIn('Content-Type', response.headers)
 
+    @budget(TEST_BUDGET)
     def test_create_plugin_file(self):
         """Test creating a plugin file (text content)"""
         plugin_content = "# Test plugin\ndef my_plugin_function():\n    return 'Hello from plugin'"
@@ -62,6 +87,7 @@ class TestFilesApiClientIntegration(unittest.TestCase):
 
         self.assertIn(response.status, [200, 201])
 
+    @budget(TEST_BUDGET)
     def test_create_binary_file(self):
         """Test creating a binary file"""
         response = self.files_client.create_or_update_file(self.test_binary_path, self.test_binary_content)
@@ -69,6 +95,7 @@ class TestFilesApiClientIntegration(unittest.TestCase):
         self.assertIn(response.status, [200, 201])
         # Note: Content type verification depends on server implementation
 
+    @budget(TEST_BUDGET)
     def test_update_existing_file(self):
         """Test updating an existing file"""
         # First create the file
@@ -80,6 +107,7 @@ class TestFilesApiClientIntegration(unittest.TestCase):
 
         self.assertIn(response.status, [200, 201])
 
+    @budget(TEST_BUDGET)
     def test_delete_file(self):
         """Test deleting a file"""
         # First create a file to delete
@@ -90,6 +118,7 @@ class TestFilesApiClientIntegration(unittest.TestCase):
 
         self.assertIn(response.status, [200, 204])  # Success or No Content
 
+    @budget(TEST_BUDGET)
     def test_get_text_file(self):
         """Test getting a text file"""
         # First create the file
@@ -102,6 +131,7 @@ class TestFilesApiClientIntegration(unittest.TestCase):
         retrieved_content = response.body.decode('utf-8') if isinstance(response.body, bytes) else response.body
         self.assertEqual(retrieved_content, self.test_text_content)
 
+    @budget(TEST_BUDGET)
     def test_get_binary_file(self):
         """Test getting a binary file"""
         # First create the binary file
@@ -113,6 +143,20 @@ class TestFilesApiClientIntegration(unittest.TestCase):
         self.assertEqual(response.status, 200)
         self.assertEqual(response.body, self.test_binary_content)
 
+    @budget(TEST_BUDGET)
+    def test_stream_binary_file(self):
+        """Test uploading from and downloading into binary file objects"""
+        response = self.files_client.create_or_update_file(self.test_binary_path, io.BytesIO(self.test_binary_content))
+        self.assertIn(response.status, [200, 201])
+
+        downloaded = io.BytesIO()
+        response = self.files_client.get_file(self.test_binary_path, dest=downloaded)
+
+        self.assertEqual(response.status, 200)
+        self.assertIsNone(response.body)
+        self.assertEqual(downloaded.getvalue(), self.test_binary_content)
+
+    @budget(TEST_BUDGET)
     def test_list_files_dags_path(self):
         """Test listing files in dags directory and validate JSON structure"""
         # Create a test file first
@@ -131,12 +175,17 @@ class TestFilesApiClientIntegration(unittest.TestCase):
         
         # Find our specific test file that we just uploaded
 
+    @budget(TEST_BUDGET)
     def test_list_files_plugins_path(self):
         """Test listing files in plugins directory and validate JSON structure"""
         # Create test files first
         plugin_content = "# test plugin with some content"
-        self.files_client.create_or_update_file(self.test_plugin_path, plugin_content)
-        self.files_client.create_or_update_file(self.test_binary_path, self.test_binary_content)
+        uploads = [
+            (self.test_plugin_path, plugin_content),
+            (self.test_binary_path, self.test_binary_content)
+        ]
+        with ThreadPoolExecutor(max_workers=len(uploads)) as executor:
+            list(executor.map(lambda upload: self.files_client.create_or_update_file(*upload), uploads))
         
         response = self.files_client.list_files(root_path="plugins")
 
@@ -149,34 +198,22 @@ class TestFilesApiClientIntegration(unittest.TestCase):
         self.assertIn('files', response_data)
         self.assertIsInstance(response_data['files'], list)
         
-        # Track our specific uploaded files
-        plugin_file_found = False
-        binary_file_found = False
-        expected_plugin_name = f'test_plugin_{self.timestamp}.py'
-        expected_binary_name = f'test_binary_{self.timestamp}.dll'
-        
+        # Index entries by path so our uploaded files are found by exact lookup
+        entries_by_path = {}
         for file_entry in response_data['files']:
             self.assertIn('filePath', file_entry)
             self.assertIn('sizeInBytes', file_entry)
             self.assertIsInstance(file_entry['sizeInBytes'], int)
-            
-            if expected_plugin_name in file_entry['filePath']:
-                plugin_file_found = True
-                #self.assertGreater(file_entry['sizeInBytes'], 0)  # Should have our content
-                self.assertEqual(file_entry['filePath'], f'plugins/{expected_plugin_name}')
-                # Verify size matches approximately what we uploaded
-                # expected_size = len(plugin_content.encode('utf-8'))
-                # self.assertEqual(file_entry['sizeInBytes'], expected_size)
-            elif expected_binary_name in file_entry['filePath']:
-                binary_file_found = True
-                self.assertEqual(file_entry['filePath'], f'plugins/{expected_binary_name}')
-                # Verify binary size matches what we uploaded
-                #self.assertGreater(file_entry['sizeInBytes'], 0)  # Should have our binary content                
-                #self.assertEqual(file_entry['sizeInBytes'], len(self.test_binary_content))
-                
-        self.assertTrue(plugin_file_found, f"Our uploaded plugin file {expected_plugin_name} not found")
-        self.assertTrue(binary_file_found, f"Our uploaded binary file {expected_binary_name} not found")
+            entries_by_path[file_entry['filePath']] = file_entry
 
+        expected_plugin_name = f'test_plugin_{self.timestamp}.py'
+        expected_binary_name = f'test_binary_{self.timestamp}.dll'
+        self.assertIn(f'plugins/{expected_plugin_name}', entries_by_path,
+                      f"Our uploaded plugin file {expected_plugin_name} not found")
+        self.assertIn(f'plugins/{expected_binary_name}', entries_by_path,
+                      f"Our uploaded binary file {expected_binary_name} not found")
+
+    @budget(TEST_BUDGET)
     def test_list_files_root_path(self):
         """Test listing files in root directory and validate JSON structure"""
         response = self.files_client.list_files(root_path="/")
@@ -191,14 +228,11 @@ class TestFilesApiClientIntegration(unittest.TestCase):
         self.assertIsInstance(response_data['files'], list)
         
         # Root directory should contain directories like 'dags/' and 'plugins/'
-        directory_paths = [file_entry['filePath'] for file_entry in response_data['files']]
+        directory_paths = {file_entry['filePath'] for file_entry in response_data['files']}
         
         # Check for expected directories (these should always exist in Airflow)
-        dags_dir_found = any(path == 'dags/' for path in directory_paths)
-        plugins_dir_found = any(path == 'plugins/' for path in directory_paths)
-        
-        self.assertTrue(dags_dir_found, f"dags/ directory not found in root listing. Found: {directory_paths}")
-        self.assertTrue(plugins_dir_found, f"plugins/ directory not found in root listing. Found: {directory_paths}")
+        self.assertIn('dags/', directory_paths, f"dags/ directory not found in root listing. Found: {directory_paths}")
+        self.assertIn('plugins/', directory_paths, f"plugins/ directory not found in root listing. Found: {directory_paths}")
         
         # Validate each entry has required fields
         for file_entry in response_data['files']:
@@ -0,0 +1,117 @@
+import io
+import unittest
+
+from fabric.airflow.client.api_exceptions import NotFoundError
+from fabric.airflow.client.fabric_files_api_client import AirflowFilesApiClient
+from tests._mocks import MockedSessionMixin, fake_response
+
+WORKSPACE_ID = "ws-1"
+AIRFLOW_JOB_ID = "job-1"
+JOB_URL = f"https://api.fabric.microsoft.com/v1/workspaces/{WORKSPACE_ID}/apacheAirflowJobs/{AIRFLOW_JOB_ID}"
+
+
+class TestFilesApiClientMocked(MockedSessionMixin, unittest.TestCase):
+    """Unit tests for Files API request construction and response handling, without network I/O"""
+
+    def setUp(self):
+        """Set up a files client backed by a mocked session"""
+        super().setUp()
+        self.files_client = AirflowFilesApiClient(
+            self.auth_provider, WORKSPACE_ID, AIRFLOW_JOB_ID, is_preview_enabled=False, session=self.session)
+
+    def test_create_text_file(self):
+        """Test that text content is sent UTF-8 encoded with a text content type"""
+        self.session.request.return_value = fake_response(201)
+
+        response = self.files_client.create_or_update_file("/dags/my_dag.py", "print('hi')")
+
+        self.assertEqual(response.status, 201)
+        request = self.sent()
+        self.assertEqual(request["method"], "PUT")
+        self.assertEqual(request["url"], f"{JOB_URL}/files/dags/my_dag.py")
+        self.assertEqual(request["data"], b"print('hi')")
+        self.assertEqual(request["headers"]["Content-Type"], "text/plain")
+        self.assertEqual(request["headers"]["Authorization"], "Bearer token")
+
+    def test_create_file_from_file_object(self):
+        """Test that a binary file object is passed through to be streamed"""
+        self.session.request.return_value = fake_response(200)
+        content = io.BytesIO(b"\x00\x01")
+
+        self.files_client.create_or_update_file("plugins/lib.bin", content)
+
+        request = self.sent()
+        self.assertIs(request["data"], content)
+        self.assertEqual(request["headers"]["Content-Type"], "application/octet-stream")
+
+    def test_get_file_returns_bytes(self):
+        """Test that file content is returned as raw bytes"""
+        self.session.request.return_value = fake_response(
+            200, b'{"not": "parsed"}', {"Content-Type": "application/json"})
+
+        response = self.files_client.get_file("dags/my_dag.py")
+
+        self.assertEqual(response.body, b'{"not": "parsed"}')
+        self.assertEqual(self.sent()["method"], "GET")
+
+    def test_get_file_into_dest(self):
+        """Test that file content is written into dest instead of the response body"""
+        self.session.request.return_value = fake_response(200, b"\x89PNG")
+        dest = io.BytesIO()
+
+        response = self.files_client.get_file("plugins/image.png", dest=dest)
+
+        self.assertIsNone(response.body)
+        self.assertEqual(dest.getvalue(), b"\x89PNG")
+        self.assertTrue(self.sent()["stream"])
+
+    def test_get_file_into_dest_logs_error_body(self):
+        """Test that in debug mode a failed download is not logged as streamed to the file"""
+        self.files_client.debug = True
+        self.session.request.return_value = fake_response(
+            404, b'{"message": "File not found"}', {"Content-Type": "application/json"})
+
+        with self.assertLogs("fabric.airflow.client.base_api_client", "INFO") as logs, \
+                self.assertRaises(NotFoundError):
+            self.files_client.get_file("plugins/missing.png", dest=io.BytesIO())
+
+        response_log = logs.output[-1]
+        self.assertNotIn("Streamed to file", response_log)
+        self.assertIn("[Binary/Stream content - 29 bytes]", response_log)
+
+    def test_list_files_parses_json(self):
+        """Test that list parameters are sent as query string and the body is parsed"""
+        self.session.request.return_value = fake_response(
+            200, b'{"files": [{"filePath": "dags/a.py", "sizeInBytes": 1}]}', {"Content-Type": "application/json"})
+
+        response = self.files_client.list_files(root_path="dags", continuation_token="abc")
+
+        self.assertEqual(self.sent()["url"], f"{JOB_URL}/files?rootPath=dags&continuationToken=abc")
+        self.assertEqual(response.body["files"][0]["filePath"], "dags/a.py")
+
+    def test_missing_file_raises_not_found(self):
+        """Test that a 404 is raised as NotFoundError with the request id from the body"""
+        self.session.request.return_value = fake_response(
+            404, b'{"message": "File not found", "requestId": "req-1"}', {"Content-Type": "application/json"})
+
+        with self.assertRaises(NotFoundError) as context:
+            self.files_client.get_file("dags/missing.py")
+
+        self.assertEqual(context.exception.request_id, "req-1")
+
+    def test_delete_files_attempts_every_file(self):
+        """Test that delete_files deletes every path and raises the first failure afterwards"""
+        def request(method, url, **kwargs):
+            status = 404 if url.endswith("missing.py") else 200
+            return fake_response(status, b"{}", {"Content-Type": "application/json"})
+        self.session.request.side_effect = request
+
+        with self.assertRaises(NotFoundError):
+            self.files_client.delete_files(["dags/a.py", "dags/missing.py", "dags/b.py"])
+
+        deleted = sorted(self.sent(i)["url"] for i in range(self.session.request.call_count))
+        self.assertEqual(deleted, [f"{JOB_URL}/files/dags/{name}" for name in ("a.py", "b.py", "missing.py")])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+from unittest import mock
+
+from fabric.airflow.client import response_cache
+from fabric.airflow.client.response_cache import ResponseCache
+
+
+class TestResponseCache(unittest.TestCase):
+    """Unit tests for ResponseCache with a controlled clock"""
+
+    def setUp(self):
+        """Set up a cache without TTL jitter and a fake monotonic clock"""
+        self.now = 1000.0
+        patcher = mock.patch.object(response_cache.time, "monotonic", side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.cache = ResponseCache(max_entries=3, ttl_jitter=0)
+
+    def test_entry_expires_after_ttl(self):
+        """Test that get() serves an entry until its TTL has passed"""
+        self.cache.set("jobs", "response", ttl=60)
+
+        self.now += 59
+        self.assertEqual(self.cache.get("jobs"), "response")
+        self.now += 1
+        self.assertIsNone(self.cache.get("jobs"))
+
+    def test_get_stale_returns_expired_entry(self):
+        """Test that an expired entry is still available for revalidation"""
+        self.cache.set("jobs", "response", ttl=60)
+        self.now += 120
+
+        self.assertIsNone(self.cache.get("jobs"))
+        self.assertEqual(self.cache.get_stale("jobs"), "response")
+        self.assertIsNone(self.cache.get_stale("items"))
+
+    def test_ttl_jitter_only_extends_lifetime(self):
+        """Test that jitter adds at most ttl_jitter of the TTL"""
+        cache = ResponseCache(ttl_jitter=0.5)
+        with mock.patch.object(response_cache.random, "uniform", return_value=0.5) as uniform:
+            cache.set("jobs", "response", ttl=60)
+
+        uniform.assert_called_once_with(0, 0.5)
+        self.now += 89
+        self.assertEqual(cache.get("jobs"), "response")
+        self.now += 1
+        self.assertIsNone(cache.get("jobs"))
+
+    def test_invalidate_tag_removes_only_tagged_entries(self):
+        """Test that invalidate_tag drops every entry carrying the tag and keeps the others"""
+        self.cache.set("ws1-jobs", "a", ttl=60, tags=("ws:1",))
+        self.cache.set("ws1-items", "b", ttl=60, tags=("ws:1", "items"))
+        self.cache.set("ws2-jobs", "c", ttl=60, tags=("ws:2",))
+
+        self.cache.invalidate_tag("ws:1")
+
+        self.assertIsNone(self.cache.get_stale("ws1-jobs"))
+        self.assertIsNone(self.cache.get_stale("ws1-items"))
+        self.assertEqual(self.cache.get("ws2-jobs"), "c")
+        self.assertEqual(len(self.cache), 1)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that the entry used least recently is evicted first once max_entries is exceeded"""
+        for key in ("a", "b", "c"):
+            self.cache.set(key, key, ttl=60)
+        self.cache.get("a")
+
+        self.cache.set("d", "d", ttl=60)
+
+        self.assertIsNone(self.cache.get_stale("b"))
+        self.assertEqual([key for key in "acd" if self.cache.get(key)], ["a", "c", "d"])
+
+    def test_invalidate_and_clear(self):
+        """Test removing a single entry and all entries"""
+        self.cache.set("a", "a", ttl=60)
+        self.cache.set("b", "b", ttl=60)
+
+        self.cache.invalidate("a")
+        self.cache.invalidate("missing")
+        self.assertEqual(len(self.cache), 1)
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()